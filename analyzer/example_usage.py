@@ -2,11 +2,26 @@
 Example usage of the Evolution Analyzer
 
 Shows how to use individual functions for custom analysis.
-Supports both CSV (legacy) and JSONL (recommended) formats.
+Examples read the JSONL export (recommended format) directly.
 """
 
+import sys
+from functools import lru_cache
 from pathlib import Path
+
+# Route pandas through the GPU (cuDF) when available; must run before
+# pandas is imported by the analyzer. Falls back to plain pandas on CPU.
+try:
+    import cudf.pandas
+    cudf.pandas.install()
+except ImportError:
+    pass
+
+import numpy as np
+import pandas as pd
+
 from src.analyzer.evolution_analyzer import (
+    cache_path,
     load_evolution_data,
     detect_species_from_csv,
     get_species_colors,
@@ -18,6 +33,95 @@ from src.analyzer.evolution_analyzer import (
 )
 
 
+DATA_PATH = 'datasets/evolution.jsonl'
+
+
+def downcast(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Shrink numeric columns to compact dtypes
+    
+    Counts (tick, population, births, deaths) become uint32 and energy means
+    float32. Columns with missing or negative values are left untouched.
+    """
+    int_cols = [
+        c for c in df.columns
+        if (c == 'tick' or c.endswith(('_population', '_births', '_deaths')))
+        and pd.api.types.is_integer_dtype(df[c]) and (df[c] >= 0).all()
+    ]
+    float_cols = [
+        c for c in df.columns
+        if c.endswith(('_energy_mean', '_avgEnergy'))
+        and pd.api.types.is_float_dtype(df[c])
+    ]
+    return df.astype({
+        **{c: 'uint32' for c in int_cols},
+        **{c: 'float32' for c in float_cols},
+    })
+
+
+@lru_cache(maxsize=4)
+def _load_cached(data_path: str, mtime: float):
+    # On-disk cache of the parsed frame; rebuilt whenever the source is newer
+    cache = cache_path(data_path, 'example-frame')
+    if cache.exists() and cache.stat().st_mtime >= mtime:
+        return pd.read_pickle(cache)
+    df = downcast(load_evolution_data(data_path))
+    try:
+        cache.parent.mkdir(parents=True, exist_ok=True)
+        df.to_pickle(cache)
+    except OSError:
+        pass  # Read-only location: skip caching
+    return df
+
+
+def load_data(data_path: str = DATA_PATH):
+    """
+    Load evolution data once per (path, mtime)
+    
+    Repeated calls (e.g. from a notebook) reuse the parsed DataFrame until
+    the file changes on disk. Treat the returned frame as read-only.
+    """
+    return _load_cached(data_path, Path(data_path).stat().st_mtime)
+
+
+def load_analysis(df, data_path: str = DATA_PATH):
+    """
+    Species list and summary stats, memoized in a sidecar cache file
+    
+    The sidecar is keyed on the frame shape and source mtime, so reruns on an
+    unchanged export skip species detection and stats computation.
+    """
+    sidecar = cache_path(data_path, 'example-analysis')
+    key = (df.shape, Path(data_path).stat().st_mtime)
+    if sidecar.exists():
+        cached = pd.read_pickle(sidecar)
+        if cached.get('key') == key:
+            return cached['species'], cached['stats']
+    
+    species = detect_species_from_csv(df)
+    stats = calculate_summary_stats(df, species)
+    try:
+        sidecar.parent.mkdir(parents=True, exist_ok=True)
+        pd.to_pickle({'key': key, 'species': species, 'stats': stats}, sidecar)
+    except OSError:
+        pass  # Read-only location: skip caching
+    return species, stats
+
+
+def _phase_stats(pop_mat: np.ndarray, midpoint: int) -> np.ndarray:
+    """
+    Early vs late phase comparison for a (ticks x species) population matrix
+    
+    Returns (species x 3) array of early mean, late mean and percent change
+    (NaN where the early mean is 0).
+    """
+    early = pop_mat[:midpoint].mean(axis=0)
+    late = pop_mat[len(pop_mat) - midpoint:].mean(axis=0)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        change = np.where(early > 0, (late - early) / early * 100, np.nan)
+    return np.column_stack((early, late, change))
+
+
 def example_basic_usage():
     """Example: Basic full report generation (JSONL format)"""
     print("Example 1: Full Report (JSONL)")
@@ -31,44 +135,22 @@ def example_basic_usage():
     )
 
 
-def example_basic_usage_csv():
-    """Example: Basic full report generation (Legacy CSV format)"""
-    print("Example 1b: Full Report (Legacy CSV)")
-    print("-" * 50)
-    
-    # Use CSV format (legacy, if JSONL not available)
-    generate_full_report(
-        data_path='datasets/evolution.csv',
-        output_dir='./my_analysis_csv',
-        stats_json_path='datasets/stats.json'
-    )
-
-
-def example_custom_analysis():
+def example_custom_analysis(df, species, stats=None):
     """Example: Custom analysis with individual functions (JSONL)"""
     print("\nExample 2: Custom Analysis (JSONL)")
     print("-" * 50)
     
-    # Load data (auto-detects JSONL format)
-    data_path = 'datasets/evolution.jsonl'
-    if not Path(data_path).exists():
-        data_path = 'datasets/evolution.csv'  # Fallback to CSV
-    
-    df = load_evolution_data(data_path)
-    print(f"Loaded {len(df)} data points from {Path(data_path).suffix} format")
-    
-    # Detect species
-    species = detect_species_from_csv(df)
     print(f"Detected species: {', '.join(species)}")
     
     # Get colors
     colors = get_species_colors(species)
     
-    # Calculate stats
-    stats = calculate_summary_stats(df, species)
-    print(f"\nAverage populations:")
-    for sp, avg_pop in stats['avg_populations'].items():
-        print(f"  {sp}: {avg_pop:.1f}")
+    # Calculate stats (unless already cached)
+    if stats is None:
+        stats = calculate_summary_stats(df, species)
+    lines = ["\nAverage populations:"]
+    lines += [f"  {sp}: {avg_pop:.1f}" for sp, avg_pop in stats['avg_populations'].items()]
+    sys.stdout.write('\n'.join(lines) + '\n')
     
     # Detect equilibrium
     eq_tick = detect_equilibrium(df, species)
@@ -82,68 +164,57 @@ def example_custom_analysis():
     print("\n✓ Generated custom_population.png")
 
 
-def example_species_specific():
+def example_species_specific(df, species):
     """Example: Analyze specific species"""
     print("\nExample 3: Species-Specific Analysis")
     print("-" * 50)
     
-    data_path = 'datasets/evolution.jsonl'
-    if not Path(data_path).exists():
-        data_path = 'datasets/evolution.csv'
+    # Analyze explorer species (reduce columns in place, no sub-frame copy)
+    population = df['explorer_population'].to_numpy()
     
-    df = load_evolution_data(data_path)
-    species = detect_species_from_csv(df)
-    
-    # Analyze explorer species
-    explorer_cols = ['tick', 'explorer_population', 'explorer_births', 'explorer_deaths']
+    lines = [
+        "\nExplorer Statistics:",
+        f"  Max population: {population.max()}",
+        f"  Min population: {population.min()}",
+    ]
     if 'explorer_energy_mean' in df.columns:
-        explorer_cols.append('explorer_energy_mean')
-    
-    explorer_data = df[explorer_cols]
-    
-    print("\nExplorer Statistics:")
-    print(f"  Max population: {explorer_data['explorer_population'].max()}")
-    print(f"  Min population: {explorer_data['explorer_population'].min()}")
-    if 'explorer_energy_mean' in df.columns:
-        print(f"  Avg energy: {explorer_data['explorer_energy_mean'].mean():.1f}")
-    print(f"  Total births: {explorer_data['explorer_births'].sum()}")
-    print(f"  Total deaths: {explorer_data['explorer_deaths'].sum()}")
+        lines.append(f"  Avg energy: {df['explorer_energy_mean'].mean():.1f}")
+    lines.append(f"  Total births: {df['explorer_births'].to_numpy().sum()}")
+    lines.append(f"  Total deaths: {df['explorer_deaths'].to_numpy().sum()}")
+    sys.stdout.write('\n'.join(lines) + '\n')
 
 
-def example_time_range():
+def example_time_range(df, species):
     """Example: Analyze specific time range"""
     print("\nExample 4: Time Range Analysis")
     print("-" * 50)
     
-    data_path = 'datasets/evolution.jsonl'
-    if not Path(data_path).exists():
-        data_path = 'datasets/evolution.csv'
-    
-    df = load_evolution_data(data_path)
-    
     # Analyze first half
     midpoint = len(df) // 2
     early_df = df.head(midpoint)
-    print(f"Early phase (first {midpoint} snapshots):")
-    print(f"  Tick range: {early_df['tick'].min()} → {early_df['tick'].max()}")
+    lines = [
+        f"Early phase (first {midpoint} snapshots):",
+        f"  Tick range: {early_df['tick'].min()} → {early_df['tick'].max()}",
+    ]
     
     # Analyze second half
     late_df = df.tail(midpoint)
-    print(f"\nLate phase (last {midpoint} snapshots):")
-    print(f"  Tick range: {late_df['tick'].min()} → {late_df['tick'].max()}")
+    lines += [
+        f"\nLate phase (last {midpoint} snapshots):",
+        f"  Tick range: {late_df['tick'].min()} → {late_df['tick'].max()}",
+    ]
     
-    # Compare populations
-    species = detect_species_from_csv(df)
-    print(f"\nPopulation changes:")
-    for sp in species:
-        pop_col = f'{sp}_population'
-        early_avg = early_df[pop_col].mean()
-        late_avg = late_df[pop_col].mean()
+    # Compare populations (single pass over the population matrix)
+    pop_mat = df[[f'{sp}_population' for sp in species]].to_numpy(dtype=np.float64)
+    phase_stats = _phase_stats(pop_mat, midpoint)
+    
+    lines.append("\nPopulation changes:")
+    for sp, (early_avg, late_avg, change) in zip(species, phase_stats):
         if early_avg > 0:
-            change = ((late_avg - early_avg) / early_avg) * 100
-            print(f"  {sp}: {early_avg:.1f} → {late_avg:.1f} ({change:+.1f}%)")
+            lines.append(f"  {sp}: {early_avg:.1f} → {late_avg:.1f} ({change:+.1f}%)")
         else:
-            print(f"  {sp}: {early_avg:.1f} → {late_avg:.1f} (N/A - extinct early)")
+            lines.append(f"  {sp}: {early_avg:.1f} → {late_avg:.1f} (N/A - extinct early)")
+    sys.stdout.write('\n'.join(lines) + '\n')
 
 
 if __name__ == '__main__':
@@ -151,16 +222,20 @@ if __name__ == '__main__':
     print("="*70)
     print("EVOLUTION ANALYZER - USAGE EXAMPLES")
     print("="*70)
-    print("\nNote: Examples will use JSONL format if available, fallback to CSV")
+    print(f"\nNote: Examples read {DATA_PATH}")
     print("="*70)
     
+    # Load once and share across examples
+    df = load_data(DATA_PATH)
+    species, stats = load_analysis(df, DATA_PATH)
+    print(f"Loaded {len(df)} data points from {Path(DATA_PATH).suffix} format")
+    
     # Uncomment the examples you want to run:
     
     # example_basic_usage()  # Full report with JSONL
-    # example_basic_usage_csv()  # Full report with CSV
-    example_custom_analysis()
-    example_species_specific()
-    example_time_range()
+    example_custom_analysis(df, species, stats)
+    example_species_specific(df, species)
+    example_time_range(df, species)
     
     print("\n" + "="*70)
     print("Examples complete! Check the generated files.")
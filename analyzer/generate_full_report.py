@@ -19,31 +19,212 @@ Output:
         - metrics.json (quantified metrics)
 """
 
+from __future__ import annotations
+
 import sys
 import json
 import argparse
 from pathlib import Path
 from datetime import datetime
+from functools import cached_property
 from typing import Dict, List, Any, Tuple
 
-import numpy as np
-import pandas as pd
-import matplotlib.pyplot as plt
-import seaborn as sns
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Heavy dependencies are imported on first use (see _import_heavy), so the
+# CLI can reject a bad path without paying for numpy/pandas/matplotlib.
+np = pd = plt = load_multirate_export = m4_indices = None
+
+
+def _import_heavy():
+    """Import numpy, pandas, matplotlib and the loader; set plot style (once per process)"""
+    global np, pd, plt, load_multirate_export, m4_indices
+    if plt is not None:
+        return
+    
+    import numpy as np
+    import pandas as pd
+    import matplotlib
+    matplotlib.use('Agg')  # File output only; skip GUI backend probing
+    import matplotlib.pyplot as plt
+    
+    # Import our multirate loader and plot downsampling kernel
+    from src.ml.multirate_loader import load_multirate_export
+    from src.ml.kernels import m4_indices
+    
+    # Set style for all plots
+    plt.style.use('seaborn-v0_8-darkgrid')
+    plt.rcParams.update({
+        # Remaining differences from seaborn's set_style("darkgrid")
+        'axes.linewidth': 0.8,
+        'font.sans-serif': ['Arial', 'DejaVu Sans', 'Liberation Sans', 'Bitstream Vera Sans', 'sans-serif'],
+        'legend.frameon': True,
+        'patch.edgecolor': 'w',
+        'patch.force_edgecolor': True,
+        'xtick.bottom': False,
+        'xtick.major.size': 3.5,
+        'xtick.minor.size': 2.0,
+        'ytick.left': False,
+        'ytick.major.size': 3.5,
+        'ytick.minor.size': 2.0,
+    })
+    plt.rcParams['figure.figsize'] = (12, 6)
+    plt.rcParams['font.size'] = 10
+    plt.rcParams['path.simplify'] = True
+    plt.rcParams['agg.path.chunksize'] = 10000
+
+
+# Figure rendering
+#
+# Analyses only collect plot data (specs); the PNGs are rendered afterwards
+# by these module-level functions, serially. Worker processes would each
+# cold-import numpy/pandas/matplotlib (seconds), more than the handful of
+# figures takes to draw. A single Figure is reused, cleared and resized per plot.
+
+_figure = None
+
 
-# Import our multirate loader
-from src.ml.multirate_loader import load_multirate_export
+def _get_figure(figsize: Tuple[float, float]) -> plt.Figure:
+    """The process-wide Figure, cleared and resized to figsize"""
+    global _figure
+    if _figure is None:
+        _figure = plt.figure(figsize=figsize, layout='constrained')
+    else:
+        _figure.clear()
+        _figure.set_size_inches(figsize)
+    return _figure
 
-# Set style for all plots
-sns.set_style("darkgrid")
-plt.rcParams['figure.figsize'] = (12, 6)
-plt.rcParams['font.size'] = 10
+
+def _decimate(x: np.ndarray, y: np.ndarray, target: int = 4000) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Downsample a series to at most target points for a line plot
+    
+    M4: keeps the first, last, min and max of target / 4 bins, about one bin
+    per pixel column of a report panel, so spikes survive downsampling.
+    """
+    if len(x) <= target:
+        return x, y
+    idx = m4_indices(x, y, target // 4)
+    return x[idx], y[idx]
+
+
+def _save_figure(fig: plt.Figure, out_path: Path):
+    # Layout is solved once by the figure's constrained layout engine (no
+    # tight_layout / bbox_inches='tight' measuring pass). Fast zlib level:
+    # slightly larger PNGs, much less encode time.
+    fig.savefig(out_path, dpi=150, metadata={'Software': None},
+                pil_kwargs={'compress_level': 1, 'optimize': False})
+
+
+def _render_population_dynamics(spec: Dict, out_path: Path):
+    fig = _get_figure((14, 5))
+    ax1, ax2 = fig.subplots(1, 2)
+    
+    # Prey populations
+    for label, ticks, values in spec['prey']:
+        ax1.plot(ticks, values, label=label, linewidth=2)
+    ax1.set_xlabel('Tick')
+    ax1.set_ylabel('Population')
+    ax1.set_title('Prey Population Dynamics')
+    ax1.legend()
+    ax1.grid(True, alpha=0.3)
+    
+    # Predator population
+    if spec['predator'] is not None:
+        ticks, values = spec['predator']
+        ax2.plot(ticks, values, label='Predator', color='red', linewidth=2)
+    ax2.set_xlabel('Tick')
+    ax2.set_ylabel('Population')
+    ax2.set_title('Predator Population Dynamics')
+    ax2.legend()
+    ax2.grid(True, alpha=0.3)
+    
+    _save_figure(fig, out_path)
+
+
+def _render_trait_evolution(spec: Dict, out_path: Path):
+    fig = _get_figure((14, 10))
+    axes = fig.subplots(2, 2).flatten()
+    
+    for ax, (trait, lines) in zip(axes, spec['traits']):
+        for label, ticks, values in lines:
+            ax.plot(ticks, values, label=label, linewidth=2, alpha=0.8)
+        
+        ax.set_xlabel('Tick')
+        ax.set_ylabel(f'{trait.capitalize()} (mean)')
+        ax.set_title(f'{trait.capitalize()} Evolution Over Time')
+        ax.legend()
+        ax.grid(True, alpha=0.3)
+    
+    _save_figure(fig, out_path)
+
+
+def _render_generation_depth(spec: Dict, out_path: Path):
+    fig = _get_figure((10, 6))
+    ax = fig.subplots()
+    
+    # Grouped bar chart
+    x = np.arange(len(spec['labels']))
+    width = 0.35
+    
+    ax.bar(x - width/2, spec['max'], width, label='Max Generation', alpha=0.8)
+    ax.bar(x + width/2, spec['avg'], width, label='Avg Generation', alpha=0.8)
+    
+    ax.set_xlabel('Species')
+    ax.set_ylabel('Generation')
+    ax.set_title('Generation Depth by Species')
+    ax.set_xticks(x)
+    ax.set_xticklabels(spec['labels'])
+    ax.legend()
+    ax.grid(True, alpha=0.3, axis='y')
+    
+    _save_figure(fig, out_path)
+
+
+def _render_genetic_diversity(spec: Dict, out_path: Path):
+    fig = _get_figure((12, 5))
+    ax1, ax2 = fig.subplots(1, 2)
+    
+    ax1.bar(spec['names'], spec['color_diversity'], alpha=0.8)
+    ax1.set_ylabel('Color Diversity Index')
+    ax1.set_title('Genetic Diversity (Color Proxy)')
+    ax1.grid(True, alpha=0.3, axis='y')
+    
+    ax2.bar(spec['names'], spec['unique_colors'], alpha=0.8, color='orange')
+    ax2.set_ylabel('Unique Colors')
+    ax2.set_title('Unique Genetic Variants')
+    ax2.grid(True, alpha=0.3, axis='y')
+    
+    _save_figure(fig, out_path)
+
+
+_RENDERERS = {
+    'population_dynamics': _render_population_dynamics,
+    'trait_evolution': _render_trait_evolution,
+    'generation_depth': _render_generation_depth,
+    'genetic_diversity': _render_genetic_diversity,
+}
+
+
+def _render_figure(job: Tuple[str, Dict, Path]):
+    """Render one queued figure"""
+    kind, spec, out_path = job
+    _import_heavy()
+    _RENDERERS[kind](spec, out_path)
 
 
 class EvolutionReportGenerator:
     """Generates comprehensive evolution analysis reports."""
     
+    # Sampling rates the analyses actually read (see self.data[...] below)
+    REPORT_RATES = [10]
+    
     def __init__(self, evolution_folder: Path):
+        _import_heavy()
+        
         self.folder = evolution_folder
         self.output_dir = evolution_folder / "analysis"
         self.graphs_dir = self.output_dir / "graphs"
@@ -52,11 +233,14 @@ class EvolutionReportGenerator:
         self.output_dir.mkdir(exist_ok=True)
         self.graphs_dir.mkdir(exist_ok=True)
         
-        # Load data
+        # Load metadata (snapshot data is loaded lazily, see `data`)
         print(f"📂 Loading data from: {evolution_folder}")
-        self.data = load_multirate_export(str(evolution_folder))
         self.metadata = self._load_metadata()
         self.final_stats = self._load_final_stats()
+        self.genetics_table = self._build_genetics_table(self.final_stats['genetics'])
+        
+        # Figures queued by the analyses, rendered by render_figures()
+        self.figure_jobs = []
         
         # Analysis results storage
         self.findings = {
@@ -67,15 +251,61 @@ class EvolutionReportGenerator:
             'performance': {}
         }
         
+    @cached_property
+    def data(self) -> Dict[str, pd.DataFrame]:
+        """Snapshot DataFrames by rate, loaded on first use (report rates only)"""
+        return load_multirate_export(str(self.folder), rates=self.REPORT_RATES, downcast=True)
+    
+    @cached_property
+    def _cols(self) -> set:
+        """Column names of the report frame, for O(1) membership checks"""
+        return set(self.data['10x'].columns)
+    
+    @cached_property
+    def _pop_cols(self) -> Dict[str, str]:
+        """Population column per species (species without one are omitted)"""
+        return {
+            sp: f'populations_{sp}' for sp in self.metadata['species']
+            if f'populations_{sp}' in self._cols
+        }
+    
+    def _read_json(self, filename: str) -> Dict:
+        """Parse a JSON file from the export folder (orjson when available)"""
+        path = self.folder / filename
+        if orjson is not None:
+            return orjson.loads(path.read_bytes())
+        with open(path) as f:
+            return json.load(f)
+    
     def _load_metadata(self) -> Dict:
         """Load metadata.json"""
-        with open(self.folder / "metadata.json") as f:
-            return json.load(f)
+        return self._read_json("metadata.json")
     
     def _load_final_stats(self) -> Dict:
         """Load stats_current.json"""
-        with open(self.folder / "stats_current.json") as f:
-            return json.load(f)
+        return self._read_json("stats_current.json")
+    
+    @staticmethod
+    def _build_genetics_table(genetics: Dict) -> pd.DataFrame:
+        """
+        Flatten per-species genetics into one row per species.
+        
+        Scalar fields keep their names (maxGeneration, colorDiversity, ...);
+        trait stats become traits_<trait>_<stat> columns. Values are kept as
+        parsed (object dtype) so ints stay ints in the exported metrics.
+        """
+        rows = {}
+        for sp, sp_genetics in genetics.items():
+            row = {k: v for k, v in sp_genetics.items() if not isinstance(v, dict)}
+            for trait, values in sp_genetics.get('traits', {}).items():
+                for stat, value in values.items():
+                    row[f'traits_{trait}_{stat}'] = value
+            rows[sp] = row
+        return pd.DataFrame(list(rows.values()), index=list(rows), dtype=object)
+    
+    def _genetics_for(self, species: List[str]) -> pd.DataFrame:
+        """Genetics table rows for the given species (in order, missing skipped)"""
+        return self.genetics_table.loc[[sp for sp in species if sp in self.genetics_table.index]]
     
     def generate_report(self):
         """Generate full analysis report."""
@@ -91,6 +321,7 @@ class EvolutionReportGenerator:
         self.analyze_reproduction_strategies()
         
         # Generate outputs
+        self.render_figures()
         self.export_report()
         self.export_metrics()
         
@@ -98,6 +329,20 @@ class EvolutionReportGenerator:
         print(f"📊 Graphs exported: {self.graphs_dir}")
         print(f"📈 Metrics saved: {self.output_dir / 'metrics.json'}")
     
+    def _queue_figure(self, kind: str, spec: Dict):
+        """Queue a figure for rendering to graphs/<kind>.png"""
+        self.figure_jobs.append((kind, spec, self.graphs_dir / f'{kind}.png'))
+    
+    def render_figures(self):
+        """Render all queued figures (serially, see the note above _get_figure)."""
+        jobs, self.figure_jobs = self.figure_jobs, []
+        if not jobs:
+            return
+        
+        print(f"  🎨 Rendering {len(jobs)} figures...")
+        for job in jobs:
+            _render_figure(job)
+    
     def analyze_population_dynamics(self):
         """Analyze population changes over time."""
         print("  📊 Analyzing population dynamics...")
@@ -110,52 +355,35 @@ class EvolutionReportGenerator:
         all_species = self.metadata['species']
         
         # Population over time
-        fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(14, 5))
-        
-        # Prey populations
-        for sp in species:
-            pop_col = f'populations_{sp}'
-            if pop_col in df.columns:
-                ax1.plot(df['tick'], df[pop_col], label=sp.capitalize(), linewidth=2)
-        ax1.set_xlabel('Tick')
-        ax1.set_ylabel('Population')
-        ax1.set_title('Prey Population Dynamics')
-        ax1.legend()
-        ax1.grid(True, alpha=0.3)
-        
-        # Predator population
-        if 'populations_predator' in df.columns:
-            ax2.plot(df['tick'], df['populations_predator'], 
-                    label='Predator', color='red', linewidth=2)
-        ax2.set_xlabel('Tick')
-        ax2.set_ylabel('Population')
-        ax2.set_title('Predator Population Dynamics')
-        ax2.legend()
-        ax2.grid(True, alpha=0.3)
-        
-        plt.tight_layout()
-        plt.savefig(self.graphs_dir / 'population_dynamics.png', dpi=150, bbox_inches='tight')
-        plt.close()
+        ticks = df['tick'].to_numpy()
+        self._queue_figure('population_dynamics', {
+            'prey': [
+                (sp.capitalize(), *_decimate(ticks, df[self._pop_cols[sp]].to_numpy()))
+                for sp in species if sp in self._pop_cols
+            ],
+            'predator': (
+                _decimate(ticks, df['populations_predator'].to_numpy())
+                if 'populations_predator' in self._cols else None
+            ),
+        })
         
         # Calculate growth rates
         final_pops = self.final_stats['populations']['byType']
         
-        # Get initial populations from first snapshot
-        first_snap = df.iloc[0]
+        # Get initial populations from first snapshot (first row of the population block)
+        present = [sp for sp in all_species if sp in self._pop_cols]
+        initials = df[[self._pop_cols[sp] for sp in present]].to_numpy(dtype=float)[0]
         growth_rates = {}
         
-        for sp in all_species:
-            pop_col = f'populations_{sp}'
-            if pop_col in df.columns:
-                initial = first_snap[pop_col]
-                final = final_pops.get(sp, 0)
-                if initial > 0:
-                    growth = ((final - initial) / initial) * 100
-                    growth_rates[sp] = {
-                        'initial': int(initial),
-                        'final': int(final),
-                        'growth_pct': round(growth, 1)
-                    }
+        for sp, initial in zip(present, initials.tolist()):
+            final = final_pops.get(sp, 0)
+            if initial > 0:
+                growth = ((final - initial) / initial) * 100
+                growth_rates[sp] = {
+                    'initial': int(initial),
+                    'final': int(final),
+                    'growth_pct': round(growth, 1)
+                }
         
         self.findings['population'] = {
             'growth_rates': growth_rates,
@@ -174,50 +402,37 @@ class EvolutionReportGenerator:
         # Key traits to track
         traits = ['speed', 'size', 'fearResponse', 'sociability']
         
-        # Create subplot for each trait
-        fig, axes = plt.subplots(2, 2, figsize=(14, 10))
-        axes = axes.flatten()
-        
-        for idx, trait in enumerate(traits):
-            ax = axes[idx]
+        # One subplot per trait
+        ticks = df['tick'].to_numpy()
+        trait_lines = []
+        for trait in traits:
+            lines = []
             for sp in species:
                 col = f'genetics_{sp}_traits_{trait}_mean'
-                if col in df.columns:
-                    # Filter out NaN values
-                    valid_data = df[['tick', col]].dropna()
-                    if len(valid_data) > 0:
-                        ax.plot(valid_data['tick'], valid_data[col], 
-                               label=sp.capitalize(), linewidth=2, alpha=0.8)
-            
-            ax.set_xlabel('Tick')
-            ax.set_ylabel(f'{trait.capitalize()} (mean)')
-            ax.set_title(f'{trait.capitalize()} Evolution Over Time')
-            ax.legend()
-            ax.grid(True, alpha=0.3)
-        
-        plt.tight_layout()
-        plt.savefig(self.graphs_dir / 'trait_evolution.png', dpi=150, bbox_inches='tight')
-        plt.close()
-        
-        # Calculate trait changes
+                if col in self._cols:
+                    # Filter out NaN values (mask, no intermediate frame)
+                    values = df[col].to_numpy()
+                    valid = ~np.isnan(values)
+                    if valid.any():
+                        lines.append((sp.capitalize(), *_decimate(ticks[valid], values[valid])))
+            trait_lines.append((trait, lines))
+        self._queue_figure('trait_evolution', {'traits': trait_lines})
+        
+        # Calculate trait changes (rows of the genetics table)
+        table = self._genetics_for(species)
+        tracked = [t for t in traits if f'traits_{t}_mean' in table.columns]
         trait_changes = {}
-        genetics = self.final_stats['genetics']
-        
-        for sp in species:
-            if sp in genetics:
-                sp_traits = genetics[sp]['traits']
-                trait_changes[sp] = {}
-                
-                for trait in traits:
-                    if trait in sp_traits:
-                        mean_val = sp_traits[trait]['mean']
-                        stddev = sp_traits[trait]['stdDev']
-                        trait_changes[sp][trait] = {
-                            'mean': round(mean_val, 4),
-                            'stdDev': round(stddev, 4),
-                            'range': [round(sp_traits[trait]['min'], 4), 
-                                     round(sp_traits[trait]['max'], 4)]
-                        }
+        
+        for sp, row in table.to_dict('index').items():
+            trait_changes[sp] = {
+                trait: {
+                    'mean': round(row[f'traits_{trait}_mean'], 4),
+                    'stdDev': round(row[f'traits_{trait}_stdDev'], 4),
+                    'range': [round(row[f'traits_{trait}_min'], 4),
+                              round(row[f'traits_{trait}_max'], 4)]
+                }
+                for trait in tracked if not pd.isna(row[f'traits_{trait}_mean'])
+            }
         
         self.findings['evolution'] = {
             'trait_changes': trait_changes
@@ -227,35 +442,33 @@ class EvolutionReportGenerator:
         """Identify selection pressures from trait variance."""
         print("  🎯 Analyzing selection pressures...")
         
-        genetics = self.final_stats['genetics']
-        species = self.metadata['species']
+        table = self._genetics_for(self.metadata['species'])
         
         # High stdDev indicates active selection
         selection_threshold = 0.02  # 2% variation indicates selection
         
+        traits = [c[len('traits_'):-len('_mean')] for c in table.columns
+                  if c.startswith('traits_') and c.endswith('_mean')]
+        means = table[[f'traits_{t}_mean' for t in traits]].to_numpy(dtype=float)
+        stddevs = table[[f'traits_{t}_stdDev' for t in traits]].to_numpy(dtype=float)
+        
+        # Coefficient of variation (only defined for positive means)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            cvs = stddevs / means
+        selected = (means > 0) & ((stddevs > selection_threshold) | (cvs > 0.05))
+        
         pressures = {}
         
-        for sp in species:
-            if sp not in genetics:
-                continue
-            
-            sp_traits = genetics[sp]['traits']
-            pressures[sp] = []
-            
-            for trait, values in sp_traits.items():
-                stddev = values['stdDev']
-                mean = values['mean']
-                
-                # Calculate coefficient of variation
-                if mean > 0:
-                    cv = stddev / mean
-                    if stddev > selection_threshold or cv > 0.05:
-                        pressures[sp].append({
-                            'trait': trait,
-                            'stdDev': round(stddev, 4),
-                            'cv': round(cv, 4),
-                            'interpretation': 'Active selection' if cv > 0.05 else 'Moderate selection'
-                        })
+        for sp, sp_selected, sp_stddevs, sp_cvs in zip(table.index, selected, stddevs, cvs):
+            pressures[sp] = [
+                {
+                    'trait': traits[i],
+                    'stdDev': round(float(sp_stddevs[i]), 4),
+                    'cv': round(float(sp_cvs[i]), 4),
+                    'interpretation': 'Active selection' if sp_cvs[i] > 0.05 else 'Moderate selection'
+                }
+                for i in np.flatnonzero(sp_selected)
+            ]
         
         self.findings['selection'] = {
             'pressures': pressures
@@ -268,29 +481,29 @@ class EvolutionReportGenerator:
         df = self.data['10x']
         species = self.metadata['species']
         
-        extinctions = []
-        
-        for sp in species:
-            pop_col = f'populations_{sp}'
-            if pop_col not in df.columns:
-                continue
-            
-            # Check if population went to zero
-            pop_series = df[pop_col].dropna()
-            if len(pop_series) > 0:
-                final_pop = pop_series.iloc[-1]
-                max_pop = pop_series.max()
-                
-                if final_pop == 0 and max_pop > 0:
-                    # Find when extinction occurred
-                    extinction_idx = pop_series[pop_series == 0].index[0]
-                    extinction_tick = df.loc[extinction_idx, 'tick']
-                    
-                    extinctions.append({
-                        'species': sp,
-                        'tick': int(extinction_tick),
-                        'max_population': int(max_pop)
-                    })
+        present = [sp for sp in species if sp in self._pop_cols]
+        pops = df[[self._pop_cols[sp] for sp in present]].to_numpy(dtype=float)
+        ticks = df['tick'].to_numpy()
+        
+        # Final (last recorded) and peak population per species, ignoring gaps
+        recorded = ~np.isnan(pops)
+        last_idx = len(pops) - 1 - recorded[::-1].argmax(axis=0)
+        final_pops = pops[last_idx, np.arange(pops.shape[1])]
+        max_pops = np.where(recorded, pops, -np.inf).max(axis=0, initial=-np.inf)
+        
+        # Went extinct = ended at zero after having been alive
+        zero = pops == 0
+        first_zero = zero.argmax(axis=0)
+        extinct = recorded.any(axis=0) & (final_pops == 0) & (max_pops > 0)
+        
+        extinctions = [
+            {
+                'species': present[i],
+                'tick': int(ticks[first_zero[i]]),
+                'max_population': int(max_pops[i])
+            }
+            for i in np.flatnonzero(extinct)
+        ]
         
         self.findings['extinction'] = {
             'events': extinctions,
@@ -301,47 +514,22 @@ class EvolutionReportGenerator:
         """Analyze generation depth as indicator of selection pressure."""
         print("  🔢 Analyzing generation depth...")
         
-        genetics = self.final_stats['genetics']
-        species = self.metadata['species']
+        table = self._genetics_for(self.metadata['species'])
         
-        # Generation depth chart
-        fig, ax = plt.subplots(figsize=(10, 6))
-        
-        gen_data = []
-        labels = []
-        
-        for sp in species:
-            if sp in genetics:
-                max_gen = genetics[sp]['maxGeneration']
-                avg_gen = genetics[sp]['avgGeneration']
-                gen_data.append({
-                    'species': sp,
-                    'max': max_gen,
-                    'avg': round(avg_gen, 2)
-                })
-                labels.append(sp.capitalize())
-        
-        # Create grouped bar chart
-        x = np.arange(len(gen_data))
-        width = 0.35
-        
-        max_gens = [d['max'] for d in gen_data]
-        avg_gens = [d['avg'] for d in gen_data]
-        
-        ax.bar(x - width/2, max_gens, width, label='Max Generation', alpha=0.8)
-        ax.bar(x + width/2, avg_gens, width, label='Avg Generation', alpha=0.8)
-        
-        ax.set_xlabel('Species')
-        ax.set_ylabel('Generation')
-        ax.set_title('Generation Depth by Species')
-        ax.set_xticks(x)
-        ax.set_xticklabels(labels)
-        ax.legend()
-        ax.grid(True, alpha=0.3, axis='y')
+        gen_data = [
+            {'species': sp, 'max': max_gen, 'avg': round(avg_gen, 2)}
+            for sp, max_gen, avg_gen in zip(
+                table.index, table['maxGeneration'].tolist(), table['avgGeneration'].tolist()
+            )
+        ]
+        labels = [sp.capitalize() for sp in table.index]
         
-        plt.tight_layout()
-        plt.savefig(self.graphs_dir / 'generation_depth.png', dpi=150, bbox_inches='tight')
-        plt.close()
+        # Generation depth chart
+        self._queue_figure('generation_depth', {
+            'labels': labels,
+            'max': [d['max'] for d in gen_data],
+            'avg': [d['avg'] for d in gen_data],
+        })
         
         self.findings['evolution']['generation_depth'] = gen_data
     
@@ -349,42 +537,21 @@ class EvolutionReportGenerator:
         """Analyze genetic diversity metrics."""
         print("  🌈 Analyzing genetic diversity...")
         
-        genetics = self.final_stats['genetics']
-        species = self.metadata['species']
-        
-        diversity_data = []
-        
-        for sp in species:
-            if sp in genetics:
-                color_div = genetics[sp]['colorDiversity']
-                unique_colors = genetics[sp]['uniqueColors']
-                
-                diversity_data.append({
-                    'species': sp,
-                    'color_diversity': round(color_div, 4),
-                    'unique_colors': unique_colors
-                })
-        
-        # Create diversity chart
-        fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(12, 5))
+        table = self._genetics_for(self.metadata['species'])
         
-        species_names = [d['species'].capitalize() for d in diversity_data]
-        color_divs = [d['color_diversity'] for d in diversity_data]
-        unique_cols = [d['unique_colors'] for d in diversity_data]
+        diversity_data = [
+            {'species': sp, 'color_diversity': round(color_div, 4), 'unique_colors': unique_colors}
+            for sp, color_div, unique_colors in zip(
+                table.index, table['colorDiversity'].tolist(), table['uniqueColors'].tolist()
+            )
+        ]
         
-        ax1.bar(species_names, color_divs, alpha=0.8)
-        ax1.set_ylabel('Color Diversity Index')
-        ax1.set_title('Genetic Diversity (Color Proxy)')
-        ax1.grid(True, alpha=0.3, axis='y')
-        
-        ax2.bar(species_names, unique_cols, alpha=0.8, color='orange')
-        ax2.set_ylabel('Unique Colors')
-        ax2.set_title('Unique Genetic Variants')
-        ax2.grid(True, alpha=0.3, axis='y')
-        
-        plt.tight_layout()
-        plt.savefig(self.graphs_dir / 'genetic_diversity.png', dpi=150, bbox_inches='tight')
-        plt.close()
+        # Diversity chart
+        self._queue_figure('genetic_diversity', {
+            'names': [d['species'].capitalize() for d in diversity_data],
+            'color_diversity': [d['color_diversity'] for d in diversity_data],
+            'unique_colors': [d['unique_colors'] for d in diversity_data],
+        })
         
         self.findings['evolution']['genetic_diversity'] = diversity_data
     
@@ -392,23 +559,20 @@ class EvolutionReportGenerator:
         """Compare reproduction strategies."""
         print("  👶 Analyzing reproduction strategies...")
         
-        genetics = self.final_stats['genetics']
         config = self.metadata['config']['speciesConfigs']
-        
-        strategies = []
-        
-        for sp, sp_config in config.items():
-            if sp in genetics:
-                repro_type = sp_config['reproductionType']
-                max_gen = genetics[sp]['maxGeneration']
-                avg_gen = genetics[sp]['avgGeneration']
-                
-                strategies.append({
-                    'species': sp,
-                    'type': repro_type,
-                    'max_generation': max_gen,
-                    'avg_generation': round(avg_gen, 2)
-                })
+        table = self._genetics_for(list(config))
+        
+        strategies = [
+            {
+                'species': sp,
+                'type': config[sp]['reproductionType'],
+                'max_generation': max_gen,
+                'avg_generation': round(avg_gen, 2)
+            }
+            for sp, max_gen, avg_gen in zip(
+                table.index, table['maxGeneration'].tolist(), table['avgGeneration'].tolist()
+            )
+        ]
         
         self.findings['evolution']['reproduction_strategies'] = strategies
     
@@ -419,13 +583,14 @@ class EvolutionReportGenerator:
         report_path = self.output_dir / 'report.md'
         
         with open(report_path, 'w') as f:
-            f.write(self._generate_markdown())
+            self._generate_markdown(f)
     
-    def _generate_markdown(self) -> str:
-        """Generate markdown report content."""
+    def _generate_markdown(self, out):
+        """Write markdown report content to an open text stream."""
         duration = self.metadata['duration']
+        w = out.write
         
-        md = f"""# Evolution Analysis Report
+        w(f"""# Evolution Analysis Report
 
 **Generated:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}  
 **Dataset:** {self.folder.name}  
@@ -437,64 +602,64 @@ class EvolutionReportGenerator:
 
 ### Final Populations
 
-"""
+""")
         
         # Population table
         growth = self.findings['population']['growth_rates']
-        md += "| Species | Initial | Final | Growth |\n"
-        md += "|---------|---------|-------|--------|\n"
+        w("| Species | Initial | Final | Growth |\n")
+        w("|---------|---------|-------|--------|\n")
         
         for sp, data in growth.items():
             growth_pct = data['growth_pct']
             growth_str = f"+{growth_pct}%" if growth_pct > 0 else f"{growth_pct}%"
-            md += f"| {sp.capitalize()} | {data['initial']} | {data['final']} | {growth_str} |\n"
+            w(f"| {sp.capitalize()} | {data['initial']} | {data['final']} | {growth_str} |\n")
         
-        md += f"\n**Total Population:** {self.findings['population']['final_total']}  \n"
-        md += f"**Prey:Predator Ratio:** {self.findings['population']['prey_predator_ratio']:.2f}:1\n\n"
+        w(f"\n**Total Population:** {self.findings['population']['final_total']}  \n")
+        w(f"**Prey:Predator Ratio:** {self.findings['population']['prey_predator_ratio']:.2f}:1\n\n")
         
-        md += "![Population Dynamics](graphs/population_dynamics.png)\n\n"
+        w("![Population Dynamics](graphs/population_dynamics.png)\n\n")
         
         # Extinction events
         extinctions = self.findings['extinction']['events']
         if extinctions:
-            md += "### ⚠️ Extinction Events\n\n"
+            w("### ⚠️ Extinction Events\n\n")
             for ext in extinctions:
-                md += f"- **{ext['species'].capitalize()}**: Extinct at tick {ext['tick']} (max pop: {ext['max_population']})\n"
-            md += "\n"
+                w(f"- **{ext['species'].capitalize()}**: Extinct at tick {ext['tick']} (max pop: {ext['max_population']})\n")
+            w("\n")
         
-        md += "---\n\n## 🧬 Trait Evolution\n\n"
-        md += "![Trait Evolution](graphs/trait_evolution.png)\n\n"
+        w("---\n\n## 🧬 Trait Evolution\n\n")
+        w("![Trait Evolution](graphs/trait_evolution.png)\n\n")
         
         # Trait changes summary
-        md += "### Key Trait Changes\n\n"
+        w("### Key Trait Changes\n\n")
         trait_changes = self.findings['evolution']['trait_changes']
         
         for sp, traits in trait_changes.items():
-            md += f"#### {sp.capitalize()}\n\n"
-            md += "| Trait | Mean | StdDev | Range |\n"
-            md += "|-------|------|--------|-------|\n"
+            w(f"#### {sp.capitalize()}\n\n")
+            w("| Trait | Mean | StdDev | Range |\n")
+            w("|-------|------|--------|-------|\n")
             
             for trait_name, values in traits.items():
                 range_str = f"{values['range'][0]:.3f} - {values['range'][1]:.3f}"
-                md += f"| {trait_name} | {values['mean']:.3f} | {values['stdDev']:.3f} | {range_str} |\n"
-            md += "\n"
+                w(f"| {trait_name} | {values['mean']:.3f} | {values['stdDev']:.3f} | {range_str} |\n")
+            w("\n")
         
-        md += "---\n\n## 🎯 Selection Pressures\n\n"
+        w("---\n\n## 🎯 Selection Pressures\n\n")
         
         pressures = self.findings['selection']['pressures']
         for sp, sp_pressures in pressures.items():
             if sp_pressures:
-                md += f"### {sp.capitalize()}\n\n"
+                w(f"### {sp.capitalize()}\n\n")
                 for p in sp_pressures:
-                    md += f"- **{p['trait']}**: {p['interpretation']} (CV: {p['cv']:.3f}, σ: {p['stdDev']:.4f})\n"
-                md += "\n"
+                    w(f"- **{p['trait']}**: {p['interpretation']} (CV: {p['cv']:.3f}, σ: {p['stdDev']:.4f})\n")
+                w("\n")
         
-        md += "---\n\n## 🔢 Generation Depth\n\n"
-        md += "![Generation Depth](graphs/generation_depth.png)\n\n"
+        w("---\n\n## 🔢 Generation Depth\n\n")
+        w("![Generation Depth](graphs/generation_depth.png)\n\n")
         
         gen_data = self.findings['evolution']['generation_depth']
-        md += "| Species | Max Gen | Avg Gen | Interpretation |\n"
-        md += "|---------|---------|---------|----------------|\n"
+        w("| Species | Max Gen | Avg Gen | Interpretation |\n")
+        w("|---------|---------|---------|----------------|\n")
         
         for data in gen_data:
             if data['max'] > 15:
@@ -504,66 +669,68 @@ class EvolutionReportGenerator:
             else:
                 interp = "Shallow evolution"
             
-            md += f"| {data['species'].capitalize()} | {data['max']} | {data['avg']:.2f} | {interp} |\n"
+            w(f"| {data['species'].capitalize()} | {data['max']} | {data['avg']:.2f} | {interp} |\n")
         
-        md += "\n---\n\n## 🌈 Genetic Diversity\n\n"
-        md += "![Genetic Diversity](graphs/genetic_diversity.png)\n\n"
+        w("\n---\n\n## 🌈 Genetic Diversity\n\n")
+        w("![Genetic Diversity](graphs/genetic_diversity.png)\n\n")
         
         diversity = self.findings['evolution']['genetic_diversity']
-        md += "| Species | Color Diversity | Unique Colors |\n"
-        md += "|---------|-----------------|---------------|\n"
+        w("| Species | Color Diversity | Unique Colors |\n")
+        w("|---------|-----------------|---------------|\n")
         
         for data in diversity:
-            md += f"| {data['species'].capitalize()} | {data['color_diversity']:.3f} | {data['unique_colors']} |\n"
+            w(f"| {data['species'].capitalize()} | {data['color_diversity']:.3f} | {data['unique_colors']} |\n")
         
-        md += "\n---\n\n## 👶 Reproduction Strategies\n\n"
+        w("\n---\n\n## 👶 Reproduction Strategies\n\n")
         
         strategies = self.findings['evolution']['reproduction_strategies']
-        md += "| Species | Type | Max Gen | Avg Gen |\n"
-        md += "|---------|------|---------|----------|\n"
+        w("| Species | Type | Max Gen | Avg Gen |\n")
+        w("|---------|------|---------|----------|\n")
         
         for strat in strategies:
-            md += f"| {strat['species'].capitalize()} | {strat['type'].capitalize()} | {strat['max_generation']} | {strat['avg_generation']:.2f} |\n"
+            w(f"| {strat['species'].capitalize()} | {strat['type'].capitalize()} | {strat['max_generation']} | {strat['avg_generation']:.2f} |\n")
         
-        md += "\n---\n\n## 💡 Key Insights\n\n"
+        w("\n---\n\n## 💡 Key Insights\n\n")
         
         # Auto-generate insights
         insights = self._generate_insights()
         for insight in insights:
-            md += f"- {insight}\n"
-        
-        md += "\n---\n\n"
-        md += f"*Report generated by Evolution Report Generator v1.0*  \n"
-        md += f"*Data: {self.folder.name}*\n"
+            w(f"- {insight}\n")
         
-        return md
+        w("\n---\n\n")
+        w(f"*Report generated by Evolution Report Generator v1.0*  \n")
+        w(f"*Data: {self.folder.name}*\n")
     
     def _generate_insights(self) -> List[str]:
         """Auto-generate key insights from data."""
         insights = []
         
-        # Population insights
+        # Population insights (threshold all species at once, report in species order)
         growth = self.findings['population']['growth_rates']
-        for sp, data in growth.items():
-            if data['growth_pct'] > 100:
-                insights.append(f"**{sp.capitalize()} population exploded** (+{data['growth_pct']:.1f}%)")
-            elif data['growth_pct'] < -50:
-                insights.append(f"**{sp.capitalize()} population collapsed** ({data['growth_pct']:.1f}%)")
+        if growth:
+            growth_pct = pd.DataFrame.from_dict(growth, orient='index')['growth_pct']
+            notable = growth_pct[(growth_pct > 100) | (growth_pct < -50)]
+            for sp, pct in notable.items():
+                if pct > 100:
+                    insights.append(f"**{sp.capitalize()} population exploded** (+{pct:.1f}%)")
+                else:
+                    insights.append(f"**{sp.capitalize()} population collapsed** ({pct:.1f}%)")
         
         # Extinction insights
         if self.findings['extinction']['count'] > 0:
             extinct = [e['species'] for e in self.findings['extinction']['events']]
             insights.append(f"**Extinction event**: {', '.join(extinct)} went extinct")
         
+        table = self._genetics_for(self.metadata['species'])
+        
         # Generation depth insights
-        gen_data = self.findings['evolution']['generation_depth']
-        deepest = max(gen_data, key=lambda x: x['max'])
-        insights.append(f"**Deepest evolution**: {deepest['species'].capitalize()} reached Gen {deepest['max']}")
+        deepest = table['maxGeneration'].astype(float).idxmax()
+        insights.append(f"**Deepest evolution**: {deepest.capitalize()} reached Gen {table.at[deepest, 'maxGeneration']}")
         
         # Diversity insights
-        diversity = self.findings['evolution']['genetic_diversity']
-        most_diverse = max(diversity, key=lambda x: x['color_diversity'])
-        insights.append(f"**Highest genetic diversity**: {most_diverse['species'].capitalize()} ({most_diverse['color_diversity']:.3f})")
+        most_diverse = table['colorDiversity'].astype(float).idxmax()
+        color_div = round(table.at[most_diverse, 'colorDiversity'], 4)
+        insights.append(f"**Highest genetic diversity**: {most_diverse.capitalize()} ({color_div:.3f})")
         
         return insights
     
@@ -571,6 +738,12 @@ class EvolutionReportGenerator:
         """Export metrics as JSON."""
         metrics_path = self.output_dir / 'metrics.json'
         
+        if orjson is not None:
+            metrics_path.write_bytes(orjson.dumps(
+                self.findings, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY
+            ))
+            return
+        
         with open(metrics_path, 'w') as f:
             json.dump(self.findings, f, indent=2)
 
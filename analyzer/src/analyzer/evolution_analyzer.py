@@ -15,14 +15,30 @@ import json
 from pathlib import Path
 from typing import Dict, List, Tuple, Optional
 
+import numpy as np
 import pandas as pd
-import matplotlib.pyplot as plt
-import seaborn as sns
+from matplotlib.figure import Figure
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # Import unified data loader
 import sys
 sys.path.insert(0, str(Path(__file__).parent.parent / 'ml'))
-from jsonl_loader import load_evolution_data as load_evolution_auto
+from jsonl_loader import cache_path, load_evolution_data as load_evolution_auto
+from kernels import first_stable_window, m4_indices, rolling_cv
+
+
+# HUSL palette (seaborn's husl_palette(20)), frozen to avoid importing seaborn.
+# Any n dividing 20 picks exactly the colors husl_palette(n) would.
+HUSL_PALETTE = (
+    '#f77189', '#f7754f', '#dc8932', '#c39532', '#ae9d31',
+    '#97a431', '#77ab31', '#31b33e', '#33b07a', '#35ae93',
+    '#36ada4', '#37abb4', '#38a9c5', '#3aa5df', '#6e9bf4',
+    '#a48cf4', '#cc7af4', '#f45cf2', '#f565cc', '#f66bad',
+)
 
 
 # ============================================
@@ -49,7 +65,9 @@ def load_evolution_data(file_path: str) -> pd.DataFrame:
 
 
 def load_stats_data(json_path: str) -> Dict:
-    """Load stats JSON data"""
+    """Load stats JSON data (parsed with orjson when available)"""
+    if orjson is not None:
+        return orjson.loads(Path(json_path).read_bytes())
     with open(json_path, 'r') as f:
         return json.load(f)
 
@@ -60,12 +78,9 @@ def detect_species_from_csv(df: pd.DataFrame) -> List[str]:
     
     Looks for columns ending in '_population' and extracts species names
     """
-    species = []
-    for col in df.columns:
-        if col.endswith('_population'):
-            species_name = col.replace('_population', '')
-            species.append(species_name)
-    return sorted(species)
+    cols = df.columns
+    pop_cols = cols[cols.str.endswith('_population', na=False)]
+    return sorted(pop_cols.str[:-len('_population')].tolist())
 
 
 def detect_species_from_stats(stats: Dict) -> List[str]:
@@ -93,12 +108,12 @@ def get_species_colors(species: List[str]) -> Dict[str, str]:
         'social': '#ff4488',
     }
     
-    # Use known colors, fallback to seaborn palette
+    # Use known colors, fallback to evenly spaced HUSL hues
     colors = {}
-    palette = sns.color_palette("husl", len(species))
+    n_palette = len(HUSL_PALETTE)
     
     for i, sp in enumerate(species):
-        colors[sp] = known_colors.get(sp, palette[i])
+        colors[sp] = known_colors.get(sp, HUSL_PALETTE[(i * n_palette // len(species)) % n_palette])
     
     return colors
 
@@ -121,37 +136,39 @@ def calculate_summary_stats(df: pd.DataFrame, species: List[str]) -> Dict:
         'death_causes': {},
     }
     
-    for sp in species:
-        pop_col = f'{sp}_population'
-        birth_col = f'{sp}_births'
-        death_col = f'{sp}_deaths'
-        
-        # Survival check
-        stats['species_survival'][sp] = (df[pop_col] > 0).all()
-        
-        # Average population
-        stats['avg_populations'][sp] = df[pop_col].mean()
-        
-        # Stability (coefficient of variation)
-        mean_pop = df[pop_col].mean()
-        if mean_pop > 0:
-            stats['stability_cv'][sp] = df[pop_col].std() / mean_pop
-        else:
-            stats['stability_cv'][sp] = float('inf')
+    # One aggregation per statistic across all species columns
+    pop_cols = [f'{sp}_population' for sp in species]
+    pops = df[pop_cols]
+    pop_agg = pops.agg(['mean', 'std'])
+    mean_pop = pop_agg.loc['mean']
+    survival = (pops > 0).all(axis=0)
+    cv = (pop_agg.loc['std'] / mean_pop).where(mean_pop > 0, float('inf'))
+    
+    sum_cols = [
+        col for sp in species
+        for col in [f'{sp}_births', f'{sp}_deaths'] +
+                   [f'{sp}_deaths_{cause}' for cause in ['old_age', 'starvation', 'predation']]
+        if col in df.columns
+    ]
+    totals = df[sum_cols].sum()
+    
+    for sp, pop_col in zip(species, pop_cols):
+        stats['species_survival'][sp] = survival[pop_col]
+        stats['avg_populations'][sp] = mean_pop[pop_col]
+        stats['stability_cv'][sp] = cv[pop_col]
         
         # Total births and deaths
-        if birth_col in df.columns:
-            stats['total_births'][sp] = df[birth_col].sum()
-        if death_col in df.columns:
-            stats['total_deaths'][sp] = df[death_col].sum()
+        if f'{sp}_births' in totals:
+            stats['total_births'][sp] = totals[f'{sp}_births']
+        if f'{sp}_deaths' in totals:
+            stats['total_deaths'][sp] = totals[f'{sp}_deaths']
         
         # Death causes (NEW!)
-        death_causes = {}
-        for cause in ['old_age', 'starvation', 'predation']:
-            cause_col = f'{sp}_deaths_{cause}'
-            if cause_col in df.columns:
-                death_causes[cause] = df[cause_col].sum()
-        stats['death_causes'][sp] = death_causes
+        stats['death_causes'][sp] = {
+            cause: totals[f'{sp}_deaths_{cause}']
+            for cause in ['old_age', 'starvation', 'predation']
+            if f'{sp}_deaths_{cause}' in totals
+        }
     
     return stats
 
@@ -163,38 +180,72 @@ def detect_equilibrium(df: pd.DataFrame, species: List[str],
     
     Equilibrium = all species have CV < threshold over rolling window
     """
-    for tick_idx in range(window, len(df)):
-        window_data = df.iloc[tick_idx-window:tick_idx]
-        all_stable = True
-        
-        for sp in species:
-            pop_col = f'{sp}_population'
-            mean_pop = window_data[pop_col].mean()
-            if mean_pop > 0:
-                cv = window_data[pop_col].std() / mean_pop
-                if cv > threshold:
-                    all_stable = False
-                    break
-        
-        if all_stable:
-            return int(df.iloc[tick_idx]['tick'])
+    pops = df[[f'{sp}_population' for sp in species]].to_numpy(dtype=np.float64)
     
-    return None
+    # Windows cover [i-window, i) and equilibrium is reported at tick i, so the
+    # last row never closes a window
+    start = first_stable_window(pops[:-1], window, threshold)
+    if start is None:
+        return None
+    return int(df['tick'].iloc[start + window])
 
 
 # ============================================
 # Plotting Functions
 # ============================================
 
-def plot_population_trends(df: pd.DataFrame, species: List[str], 
-                          colors: Dict[str, str], save_path: Optional[str] = None):
-    """Plot population trends over time"""
-    fig, ax = plt.subplots(figsize=(14, 8))
+# Figures reused across plots, keyed by size. Plain Figure objects (not
+# pyplot-managed), so they never pop up in notebooks and need no closing.
+# Constrained layout solves the layout once at draw time, replacing the
+# measure-then-render passes of tight_layout / bbox_inches='tight'.
+_FIGURES: Dict[Tuple[float, float], Figure] = {}
+
+# Skip the PNG 'Software' text chunk
+_PNG_METADATA = {'Software': None}
+
+# Horizontal resolution for line downsampling: 14in figures at 300 dpi
+_PLOT_BINS = 14 * 300
+
+
+def _get_figure(figsize: Tuple[float, float]) -> Figure:
+    """Cached figure of the given size, cleared for a fresh plot"""
+    fig = _FIGURES.get(figsize)
+    if fig is None:
+        fig = _FIGURES[figsize] = Figure(figsize=figsize, layout='constrained')
+    else:
+        fig.clear()
+    return fig
+
+
+def _downsample(x: np.ndarray, values: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    M4-downsample a (ticks x lines) block for plotting
     
-    for sp in species:
-        pop_col = f'{sp}_population'
-        ax.plot(df['tick'], df[pop_col], 
-               label=sp.capitalize(), color=colors[sp], linewidth=2, alpha=0.9)
+    Keeps the first, last, min and max point per horizontal pixel, so long
+    runs render far fewer segments with no visible change.
+    """
+    idx = m4_indices(x, values, _PLOT_BINS)
+    if len(idx) == len(x):
+        return x, values
+    return x[idx], values[idx]
+
+
+def plot_population_trends(df: pd.DataFrame, species: List[str], 
+                          colors: Dict[str, str], save_path: Optional[str] = None,
+                          x: Optional[np.ndarray] = None):
+    """Plot population trends over time (x: precomputed tick array)"""
+    if x is None:
+        x = df['tick'].to_numpy()
+    fig = _get_figure((14, 8))
+    ax = fig.subplots()
+    
+    # One plot call for the whole (ticks x species) block, one line per column
+    if species:
+        pop_block = df[[f'{sp}_population' for sp in species]].to_numpy()
+        lines = ax.plot(*_downsample(x, pop_block), label=[sp.capitalize() for sp in species],
+                        linewidth=2, alpha=0.9, rasterized=True)
+        for line, sp in zip(lines, species):
+            line.set_color(colors[sp])
     
     ax.set_xlabel('Tick', fontsize=12)
     ax.set_ylabel('Population', fontsize=12)
@@ -202,23 +253,28 @@ def plot_population_trends(df: pd.DataFrame, species: List[str],
     ax.legend(loc='best', framealpha=0.9)
     ax.grid(True, alpha=0.3)
     
-    plt.tight_layout()
     if save_path:
-        plt.savefig(save_path, dpi=300, bbox_inches='tight')
+        fig.savefig(save_path, dpi=300, metadata=_PNG_METADATA)
         print(f"  ✓ Saved: {save_path}")
-    plt.close()
 
 
 def plot_energy_trends(df: pd.DataFrame, species: List[str], 
-                      colors: Dict[str, str], save_path: Optional[str] = None):
+                      colors: Dict[str, str], save_path: Optional[str] = None,
+                      x: Optional[np.ndarray] = None):
     """Plot average energy levels over time (NEW SCHEMA: energy_mean)"""
-    fig, ax = plt.subplots(figsize=(14, 8))
-    
-    for sp in species:
-        energy_col = f'{sp}_energy_mean'
-        if energy_col in df.columns:
-            ax.plot(df['tick'], df[energy_col], 
-                   label=sp.capitalize(), color=colors[sp], linewidth=2, alpha=0.8)
+    if x is None:
+        x = df['tick'].to_numpy()
+    fig = _get_figure((14, 8))
+    ax = fig.subplots()
+    
+    # One plot call for the whole (ticks x species) block, one line per column
+    energy_species = [sp for sp in species if f'{sp}_energy_mean' in df.columns]
+    if energy_species:
+        energy_block = df[[f'{sp}_energy_mean' for sp in energy_species]].to_numpy()
+        lines = ax.plot(*_downsample(x, energy_block), label=[sp.capitalize() for sp in energy_species],
+                        linewidth=2, alpha=0.8, rasterized=True)
+        for line, sp in zip(lines, energy_species):
+            line.set_color(colors[sp])
     
     ax.set_xlabel('Tick', fontsize=12)
     ax.set_ylabel('Average Energy', fontsize=12)
@@ -226,27 +282,33 @@ def plot_energy_trends(df: pd.DataFrame, species: List[str],
     ax.legend(loc='best', framealpha=0.9)
     ax.grid(True, alpha=0.3)
     
-    plt.tight_layout()
     if save_path:
-        plt.savefig(save_path, dpi=300, bbox_inches='tight')
+        fig.savefig(save_path, dpi=300, metadata=_PNG_METADATA)
         print(f"  ✓ Saved: {save_path}")
-    plt.close()
 
 
 def plot_birth_death_rates(df: pd.DataFrame, species: List[str], 
-                           colors: Dict[str, str], save_path: Optional[str] = None):
+                           colors: Dict[str, str], save_path: Optional[str] = None,
+                           x: Optional[np.ndarray] = None):
     """Plot birth and death rates with rolling average"""
-    fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(14, 10))
+    if x is None:
+        x = df['tick'].to_numpy()
+    fig = _get_figure((14, 10))
+    ax1, ax2 = fig.subplots(2, 1)
     
     window = 10  # Rolling average window
     
+    # Rolling averages for all species in one block per metric
+    birth_species = [sp for sp in species if f'{sp}_births' in df.columns]
+    death_species = [sp for sp in species if f'{sp}_deaths' in df.columns]
+    rolling_births = df[[f'{sp}_births' for sp in birth_species]].rolling(window, min_periods=1).mean()
+    rolling_deaths = df[[f'{sp}_deaths' for sp in death_species]].rolling(window, min_periods=1).mean()
+    
     # Births
-    for sp in species:
-        birth_col = f'{sp}_births'
-        if birth_col in df.columns:
-            rolling_births = df[birth_col].rolling(window, min_periods=1).mean()
-            ax1.plot(df['tick'], rolling_births, 
-                    label=sp.capitalize(), color=colors[sp], linewidth=2)
+    xb, births_block = _downsample(x, rolling_births.to_numpy())
+    for i, sp in enumerate(birth_species):
+        ax1.plot(xb, births_block[:, i], 
+                label=sp.capitalize(), color=colors[sp], linewidth=2, rasterized=True)
     
     ax1.set_ylabel(f'Births ({window}-tick rolling avg)', fontsize=12)
     ax1.set_title('Birth Rates Over Time', fontsize=14, fontweight='bold')
@@ -254,12 +316,10 @@ def plot_birth_death_rates(df: pd.DataFrame, species: List[str],
     ax1.grid(True, alpha=0.3)
     
     # Deaths
-    for sp in species:
-        death_col = f'{sp}_deaths'
-        if death_col in df.columns:
-            rolling_deaths = df[death_col].rolling(window, min_periods=1).mean()
-            ax2.plot(df['tick'], rolling_deaths, 
-                    label=sp.capitalize(), color=colors[sp], linewidth=2)
+    xd, deaths_block = _downsample(x, rolling_deaths.to_numpy())
+    for i, sp in enumerate(death_species):
+        ax2.plot(xd, deaths_block[:, i], 
+                label=sp.capitalize(), color=colors[sp], linewidth=2, rasterized=True)
     
     ax2.set_xlabel('Tick', fontsize=12)
     ax2.set_ylabel(f'Deaths ({window}-tick rolling avg)', fontsize=12)
@@ -267,44 +327,34 @@ def plot_birth_death_rates(df: pd.DataFrame, species: List[str],
     ax2.legend(loc='best', framealpha=0.9)
     ax2.grid(True, alpha=0.3)
     
-    plt.tight_layout()
     if save_path:
-        plt.savefig(save_path, dpi=300, bbox_inches='tight')
+        fig.savefig(save_path, dpi=300, metadata=_PNG_METADATA)
         print(f"  ✓ Saved: {save_path}")
-    plt.close()
 
 
 def plot_death_causes(df: pd.DataFrame, species: List[str], 
                      colors: Dict[str, str], save_path: Optional[str] = None):
     """Plot death causes breakdown (NEW!)"""
-    fig, ax = plt.subplots(figsize=(14, 8))
+    fig = _get_figure((14, 8))
+    ax = fig.subplots()
     
     causes = ['old_age', 'starvation', 'predation']
     cause_labels = ['Old Age', 'Starvation', 'Predation']
     
-    # Aggregate death causes per species
-    data = []
-    for sp in species:
-        sp_data = {'species': sp.capitalize()}
-        for cause in causes:
-            cause_col = f'{sp}_deaths_{cause}'
-            if cause_col in df.columns:
-                sp_data[cause] = df[cause_col].sum()
-            else:
-                sp_data[cause] = 0
-        data.append(sp_data)
-    
-    death_df = pd.DataFrame(data)
+    # Aggregate death causes per species (one sum over the whole block,
+    # missing columns count as 0) -> (species x causes) matrix
+    cause_cols = [f'{sp}_deaths_{cause}' for sp in species for cause in causes]
+    totals = (df.reindex(columns=cause_cols, fill_value=0).sum(axis=0)
+              .to_numpy().reshape(len(species), len(causes)))
     
     # Create stacked bar chart
     x = range(len(species))
     width = 0.6
     
-    bottom = [0] * len(species)
-    for i, cause in enumerate(causes):
-        values = death_df[cause].values
-        ax.bar(x, values, width, label=cause_labels[i], bottom=bottom)
-        bottom = [bottom[j] + values[j] for j in range(len(values))]
+    bottom = np.zeros(len(species))
+    for i, label in enumerate(cause_labels):
+        ax.bar(x, totals[:, i], width, label=label, bottom=bottom)
+        bottom += totals[:, i]
     
     ax.set_xlabel('Species', fontsize=12)
     ax.set_ylabel('Total Deaths', fontsize=12)
@@ -314,29 +364,30 @@ def plot_death_causes(df: pd.DataFrame, species: List[str],
     ax.legend(loc='best', framealpha=0.9)
     ax.grid(True, alpha=0.3, axis='y')
     
-    plt.tight_layout()
     if save_path:
-        plt.savefig(save_path, dpi=300, bbox_inches='tight')
+        fig.savefig(save_path, dpi=300, metadata=_PNG_METADATA)
         print(f"  ✓ Saved: {save_path}")
-    plt.close()
 
 
 def plot_stability_metrics(df: pd.DataFrame, species: List[str], 
-                           colors: Dict[str, str], save_path: Optional[str] = None):
+                           colors: Dict[str, str], save_path: Optional[str] = None,
+                           x: Optional[np.ndarray] = None):
     """Plot stability metrics (rolling CV) over time"""
-    fig, ax = plt.subplots(figsize=(14, 8))
+    if x is None:
+        x = df['tick'].to_numpy()
+    fig = _get_figure((14, 8))
+    ax = fig.subplots()
     
     window = 100  # Rolling window for CV calculation
     
-    for sp in species:
-        pop_col = f'{sp}_population'
-        # Calculate rolling CV
-        rolling_mean = df[pop_col].rolling(window, min_periods=1).mean()
-        rolling_std = df[pop_col].rolling(window, min_periods=1).std()
-        rolling_cv = rolling_std / rolling_mean
-        
-        ax.plot(df['tick'], rolling_cv, 
-               label=sp.capitalize(), color=colors[sp], linewidth=2, alpha=0.8)
+    # Calculate rolling CV for all species in one streaming pass
+    pop_block = df[[f'{sp}_population' for sp in species]].to_numpy(dtype=np.float64)
+    cv_block = rolling_cv(pop_block, window, min_periods=1)
+    xs, cv_block = _downsample(x, cv_block)
+    
+    for i, sp in enumerate(species):
+        ax.plot(xs, cv_block[:, i], 
+               label=sp.capitalize(), color=colors[sp], linewidth=2, alpha=0.8, rasterized=True)
     
     # Add stability threshold line
     ax.axhline(y=0.1, color='gray', linestyle='--', linewidth=1, 
@@ -350,15 +401,14 @@ def plot_stability_metrics(df: pd.DataFrame, species: List[str],
     ax.grid(True, alpha=0.3)
     ax.set_ylim(0, 0.5)  # Limit y-axis for readability
     
-    plt.tight_layout()
     if save_path:
-        plt.savefig(save_path, dpi=300, bbox_inches='tight')
+        fig.savefig(save_path, dpi=300, metadata=_PNG_METADATA)
         print(f"  ✓ Saved: {save_path}")
-    plt.close()
 
 
 def plot_prey_predator_ratio(df: pd.DataFrame, species: List[str], 
-                             save_path: Optional[str] = None):
+                             save_path: Optional[str] = None,
+                             x: Optional[np.ndarray] = None):
     """Plot prey to predator ratio over time"""
     # Identify prey and predators
     predator_species = [sp for sp in species if 'predator' in sp.lower()]
@@ -368,16 +418,19 @@ def plot_prey_predator_ratio(df: pd.DataFrame, species: List[str],
         print("  ⚠ Skipping prey/predator ratio plot (no predators detected)")
         return
     
-    # Calculate total prey and predator populations
-    prey_total = sum(df[f'{sp}_population'] for sp in prey_species)
-    predator_total = sum(df[f'{sp}_population'] for sp in predator_species)
+    # Calculate total prey and predator populations (gaps propagate as NaN)
+    prey_total = df[[f'{sp}_population' for sp in prey_species]].sum(axis=1, skipna=False).to_numpy()
+    predator_total = df[[f'{sp}_population' for sp in predator_species]].sum(axis=1, skipna=False).to_numpy()
     
     # Calculate ratio (avoid division by zero)
-    ratio = prey_total / predator_total.replace(0, float('nan'))
+    ratio = np.where(predator_total > 0, prey_total / np.maximum(predator_total, 1), np.nan)
     
-    fig, ax = plt.subplots(figsize=(14, 8))
+    fig = _get_figure((14, 8))
+    ax = fig.subplots()
     
-    ax.plot(df['tick'], ratio, color='#8b4513', linewidth=2)
+    if x is None:
+        x = df['tick'].to_numpy()
+    ax.plot(*_downsample(x, ratio), color='#8b4513', linewidth=2, rasterized=True)
     ax.axhline(y=10, color='green', linestyle='--', linewidth=1, 
               label='Target Ratio (10:1)')
     
@@ -387,11 +440,9 @@ def plot_prey_predator_ratio(df: pd.DataFrame, species: List[str],
     ax.legend(loc='best', framealpha=0.9)
     ax.grid(True, alpha=0.3)
     
-    plt.tight_layout()
     if save_path:
-        plt.savefig(save_path, dpi=300, bbox_inches='tight')
+        fig.savefig(save_path, dpi=300, metadata=_PNG_METADATA)
         print(f"  ✓ Saved: {save_path}")
-    plt.close()
 
 
 # ============================================
@@ -399,32 +450,35 @@ def plot_prey_predator_ratio(df: pd.DataFrame, species: List[str],
 # ============================================
 
 def print_summary_report(stats: Dict, species: List[str], equilibrium_tick: Optional[int]):
-    """Print summary report to console"""
-    print("\n" + "="*70)
-    print("🔬 EVOLUTION ANALYSIS REPORT")
-    print("="*70)
+    """Print summary report to console (built in memory, written once)"""
+    lines = []
+    w = lines.append
+    
+    w("\n" + "="*70)
+    w("🔬 EVOLUTION ANALYSIS REPORT")
+    w("="*70)
     
     # Basic stats
-    print(f"\n📊 Run Statistics:")
-    print(f"  Total Ticks: {stats['total_ticks']:,}")
-    print(f"  Tick Range: {stats['tick_range'][0]:,} → {stats['tick_range'][1]:,}")
-    print(f"  Duration: {stats['duration_seconds']:.2f} seconds")
+    w(f"\n📊 Run Statistics:")
+    w(f"  Total Ticks: {stats['total_ticks']:,}")
+    w(f"  Tick Range: {stats['tick_range'][0]:,} → {stats['tick_range'][1]:,}")
+    w(f"  Duration: {stats['duration_seconds']:.2f} seconds")
     
     # Species survival
-    print(f"\n🦠 Species Survival:")
+    w(f"\n🦠 Species Survival:")
     for sp in species:
         survived = stats['species_survival'][sp]
         status = "✅ ALIVE" if survived else "❌ EXTINCT"
-        print(f"  {sp.capitalize():15} {status}")
+        w(f"  {sp.capitalize():15} {status}")
     
     # Average populations
-    print(f"\n📈 Average Populations:")
+    w(f"\n📈 Average Populations:")
     for sp in species:
         avg_pop = stats['avg_populations'][sp]
-        print(f"  {sp.capitalize():15} {avg_pop:6.1f}")
+        w(f"  {sp.capitalize():15} {avg_pop:6.1f}")
     
     # Stability
-    print(f"\n🎯 Stability (CV - lower is better):")
+    w(f"\n🎯 Stability (CV - lower is better):")
     for sp in species:
         cv = stats['stability_cv'][sp]
         if cv == float('inf'):
@@ -437,41 +491,42 @@ def print_summary_report(stats: Dict, species: List[str], equilibrium_tick: Opti
             stability = "Oscillating"
         else:
             stability = "Unstable"
-        print(f"  {sp.capitalize():15} {cv:6.3f} ({stability})")
+        w(f"  {sp.capitalize():15} {cv:6.3f} ({stability})")
     
     # Births and deaths
     if stats['total_births']:
-        print(f"\n👶 Total Births:")
+        w(f"\n👶 Total Births:")
         for sp in species:
             births = stats['total_births'].get(sp, 0)
-            print(f"  {sp.capitalize():15} {births:6,}")
+            w(f"  {sp.capitalize():15} {births:6,}")
     
     if stats['total_deaths']:
-        print(f"\n💀 Total Deaths:")
+        w(f"\n💀 Total Deaths:")
         for sp in species:
             deaths = stats['total_deaths'].get(sp, 0)
-            print(f"  {sp.capitalize():15} {deaths:6,}")
+            w(f"  {sp.capitalize():15} {deaths:6,}")
     
     # Death causes (NEW!)
-    print(f"\n💀 Death Causes:")
+    w(f"\n💀 Death Causes:")
     for sp in species:
         causes = stats['death_causes'].get(sp, {})
         if causes:
-            print(f"  {sp.capitalize()}:")
+            w(f"  {sp.capitalize()}:")
             for cause, count in causes.items():
                 if count > 0:
-                    print(f"    {cause:12} {count:6,}")
+                    w(f"    {cause:12} {count:6,}")
     
     # Equilibrium
     if equilibrium_tick:
-        print(f"\n⚖️  Equilibrium:")
-        print(f"  Reached at tick: {equilibrium_tick:,}")
-        print(f"  Time to equilibrium: {(equilibrium_tick / stats['tick_range'][1]) * 100:.1f}% of run")
+        w(f"\n⚖️  Equilibrium:")
+        w(f"  Reached at tick: {equilibrium_tick:,}")
+        w(f"  Time to equilibrium: {(equilibrium_tick / stats['tick_range'][1]) * 100:.1f}% of run")
     else:
-        print(f"\n⚖️  Equilibrium:")
-        print(f"  System still stabilizing (no equilibrium detected)")
+        w(f"\n⚖️  Equilibrium:")
+        w(f"  System still stabilizing (no equilibrium detected)")
     
-    print("\n" + "="*70)
+    w("\n" + "="*70)
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 def generate_full_report(data_path: str, output_dir: str = './analysis', 
@@ -529,13 +584,14 @@ def generate_full_report(data_path: str, output_dir: str = './analysis',
     output_path.mkdir(exist_ok=True)
     print(f"\n📊 Generating visualizations in: {output_dir}/")
     
-    # Generate all plots
-    plot_population_trends(df, species, colors, f'{output_dir}/population_trends.png')
-    plot_energy_trends(df, species, colors, f'{output_dir}/energy_trends.png')
-    plot_birth_death_rates(df, species, colors, f'{output_dir}/birth_death_rates.png')
+    # Generate all plots (tick axis converted once and shared)
+    x = df['tick'].to_numpy()
+    plot_population_trends(df, species, colors, f'{output_dir}/population_trends.png', x=x)
+    plot_energy_trends(df, species, colors, f'{output_dir}/energy_trends.png', x=x)
+    plot_birth_death_rates(df, species, colors, f'{output_dir}/birth_death_rates.png', x=x)
     plot_death_causes(df, species, colors, f'{output_dir}/death_causes.png')
-    plot_stability_metrics(df, species, colors, f'{output_dir}/stability_metrics.png')
-    plot_prey_predator_ratio(df, species, f'{output_dir}/prey_predator_ratio.png')
+    plot_stability_metrics(df, species, colors, f'{output_dir}/stability_metrics.png', x=x)
+    plot_prey_predator_ratio(df, species, f'{output_dir}/prey_predator_ratio.png', x=x)
     
     print(f"\n✅ Analysis complete!")
     print(f"📁 Check {output_dir}/ for all generated plots")
@@ -547,34 +603,36 @@ def generate_full_report(data_path: str, output_dir: str = './analysis',
 # ============================================
 
 if __name__ == '__main__':
+    import os
     import sys
     
-    # Default paths (can be overridden via command line)
-    if len(sys.argv) > 1:
-        data_path = sys.argv[1]
-    else:
-        # Try JSONL first (preferred), then CSV (legacy)
-        jsonl_path = 'datasets/evolution.jsonl'
-        csv_path = 'datasets/evolution.csv'
-        
-        if Path(jsonl_path).exists():
-            data_path = jsonl_path
-        elif Path(csv_path).exists():
-            data_path = csv_path
+    # Default paths (can be overridden via command line).
+    # Without an argument, try JSONL first (preferred), then CSV (legacy)
+    jsonl_path = 'datasets/evolution.jsonl'
+    csv_path = 'datasets/evolution.csv'
+    candidates = sys.argv[1:2] or [jsonl_path, csv_path]
+    
+    # One stat per candidate: the first that exists wins
+    data_path = None
+    for candidate in candidates:
+        try:
+            os.stat(candidate)
+        except FileNotFoundError:
+            continue
+        data_path = candidate
+        break
+    
+    if data_path is None:
+        if len(sys.argv) > 1:
+            print(f"❌ Error: {sys.argv[1]} not found")
         else:
             print(f"❌ Error: No evolution data file found")
             print(f"   Tried: {jsonl_path}, {csv_path}")
-            print(f"   Usage: python evolution_analyzer.py [path/to/evolution.jsonl]")
-            sys.exit(1)
+        print(f"   Usage: python evolution_analyzer.py [path/to/evolution.jsonl]")
+        sys.exit(1)
     
     stats_path = 'datasets/stats.json'
     output_dir = './analysis'
     
-    # Check if data file exists
-    if not Path(data_path).exists():
-        print(f"❌ Error: {data_path} not found")
-        print(f"   Usage: python evolution_analyzer.py [path/to/evolution.jsonl]")
-        sys.exit(1)
-    
     # Run analysis
     generate_full_report(data_path, output_dir, stats_path)
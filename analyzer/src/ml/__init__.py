@@ -17,10 +17,12 @@ from .feature_engineering import (
     calculate_birth_rate,
     calculate_death_rate,
     calculate_growth_rate,
+    calculate_vital_rates,
     calculate_rolling_cv,
     calculate_rolling_mean,
     calculate_rolling_std,
     calculate_species_dominance,
+    classify_growth,
     calculate_prey_predator_ratio,
     aggregate_species_metric,
     normalize_z_score,
@@ -47,6 +49,7 @@ from .models import (
     compare_regression_models,
     compare_classification_models,
     evaluate_regression,
+    evaluate_regression_batch,
     evaluate_classification,
 )
 
@@ -64,10 +67,12 @@ __all__ = [
     'calculate_birth_rate',
     'calculate_death_rate',
     'calculate_growth_rate',
+    'calculate_vital_rates',
     'calculate_rolling_cv',
     'calculate_rolling_mean',
     'calculate_rolling_std',
     'calculate_species_dominance',
+    'classify_growth',
     'calculate_prey_predator_ratio',
     'aggregate_species_metric',
     'normalize_z_score',
@@ -88,6 +93,7 @@ __all__ = [
     'compare_regression_models',
     'compare_classification_models',
     'evaluate_regression',
+    'evaluate_regression_batch',
     'evaluate_classification',
 ]
 
@@ -7,17 +7,25 @@ No classes, just functions that transform data.
 Supports both legacy CSV format and new JSONL format.
 """
 
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
+import numpy as np
 import pandas as pd
 import json
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Import JSONL loader
 try:
     from .jsonl_loader import (
         load_evolution_jsonl,
         load_evolution_data as load_evolution_auto,
         detect_species_from_snapshots,
+        cache_path,
     )
 except ImportError:
     # Running as main script
@@ -25,6 +33,7 @@ except ImportError:
         load_evolution_jsonl,
         load_evolution_data as load_evolution_auto,
         detect_species_from_snapshots,
+        cache_path,
     )
 
 
@@ -44,14 +53,29 @@ def load_evolution_csv(csv_path: str) -> pd.DataFrame:
     - Atmosphere events
     
     Note: CSV format is deprecated. Use JSONL format for full data coverage.
+    
+    The parsed frame is cached as a pickle in the per-user cache directory
+    (see cache_path) and reused until the CSV is modified, so repeated loads
+    skip parsing entirely.
     """
+    cache = cache_path(csv_path, 'frame')
+    if cache.exists() and cache.stat().st_mtime >= Path(csv_path).stat().st_mtime:
+        return pd.read_pickle(cache)
+    
     df = pd.read_csv(csv_path)
     df['date'] = pd.to_datetime(df['date'])
+    try:
+        cache.parent.mkdir(parents=True, exist_ok=True)
+        df.to_pickle(cache)
+    except OSError:
+        pass  # Read-only location: skip caching
     return df
 
 
 def load_stats_json(json_path: str) -> Dict:
-    """Load current stats JSON snapshot"""
+    """Load current stats JSON snapshot (parsed with orjson when available)"""
+    if orjson is not None:
+        return orjson.loads(Path(json_path).read_bytes())
     with open(json_path, 'r') as f:
         return json.load(f)
 
@@ -96,13 +120,16 @@ def detect_species_from_columns(df: pd.DataFrame) -> List[str]:
     
     Looks for columns ending in '_population' and extracts species names.
     Returns sorted list of species identifiers.
+    Memoized on the column names, so repeated calls on the same schema are free.
     """
-    species = set()
-    for col in df.columns:
-        if col.endswith('_population'):
-            species_name = col.replace('_population', '')
-            species.add(species_name)
-    return sorted(species)
+    return list(_species_for_columns(tuple(df.columns)))
+
+
+@lru_cache(maxsize=32)
+def _species_for_columns(columns: Tuple) -> Tuple[str, ...]:
+    cols = pd.Index(columns)
+    pop_cols = cols[cols.str.endswith('_population', na=False)]
+    return tuple(sorted(set(pop_cols.str[:-len('_population')])))
 
 
 def classify_species_role(species_name: str) -> str:
@@ -120,9 +147,16 @@ def partition_species_by_role(species: List[str]) -> Dict[str, List[str]]:
     
     Returns dict with 'prey' and 'predator' keys.
     """
-    prey = [sp for sp in species if classify_species_role(sp) == 'prey']
-    predators = [sp for sp in species if classify_species_role(sp) == 'predator']
-    return {'prey': prey, 'predator': predators}
+    prey, predators = _partition_roles(tuple(species))
+    return {'prey': list(prey), 'predator': list(predators)}
+
+
+@lru_cache(maxsize=32)
+def _partition_roles(species: Tuple[str, ...]) -> Tuple[Tuple[str, ...], Tuple[str, ...]]:
+    roles = [classify_species_role(sp) for sp in species]
+    prey = tuple(sp for sp, role in zip(species, roles) if role == 'prey')
+    predators = tuple(sp for sp, role in zip(species, roles) if role == 'predator')
+    return prey, predators
 
 
 # ============================================
@@ -217,16 +251,24 @@ def extract_death_causes(df: pd.DataFrame, species: List[str]) -> pd.DataFrame:
     Returns DataFrame with columns: species, cause, count
     """
     causes = ['old_age', 'starvation', 'predation']
-    rows = []
-    
-    for sp in species:
-        for cause in causes:
-            col_name = build_death_cause_col(sp, cause)
-            if col_name in df.columns:
-                total = df[col_name].sum()
-                rows.append({'species': sp, 'cause': cause, 'count': total})
-    
-    return pd.DataFrame(rows)
+    present = [
+        (sp, cause, col_name)
+        for sp in species
+        for cause in causes
+        if (col_name := build_death_cause_col(sp, cause)) in df.columns
+    ]
+    if not present:
+        return pd.DataFrame()
+    
+    # One reduction over the whole block of cause columns
+    sp_names, cause_names, cols = zip(*present)
+    totals = df[list(cols)].sum()
+    
+    return pd.DataFrame({
+        'species': sp_names,
+        'cause': cause_names,
+        'count': totals.to_numpy(),
+    })
 
 
 # ============================================
@@ -240,17 +282,18 @@ def aggregate_by_role(df: pd.DataFrame, species_by_role: Dict[str, List[str]],
     
     Returns DataFrame with 'prey_total' and 'predator_total' columns.
     """
-    result = df[['tick']].copy()
+    col_set = set(df.columns)
+    result = {'tick': df['tick'].to_numpy()}
     
     for role, species_list in species_by_role.items():
-        cols = [f'{sp}_{metric}' for sp in species_list]
-        available_cols = [col for col in cols if col in df.columns]
-        if available_cols:
-            result[f'{role}_total'] = df[available_cols].sum(axis=1)
+        cols = [f'{sp}_{metric}' for sp in species_list if f'{sp}_{metric}' in col_set]
+        if cols:
+            # NaN-skipping row sum, like DataFrame.sum(axis=1)
+            result[f'{role}_total'] = np.nansum(df[cols].to_numpy(), axis=1)
         else:
-            result[f'{role}_total'] = 0
+            result[f'{role}_total'] = np.zeros(len(df), dtype=np.int64)
     
-    return result.set_index('tick')
+    return pd.DataFrame(result).set_index('tick')
 
 
 def calculate_prey_predator_ratio(df: pd.DataFrame, 
@@ -275,17 +318,22 @@ def summarize_dataset(df: pd.DataFrame, species: List[str]) -> Dict:
     
     Pure function - returns dict with summary statistics.
     """
+    col_set = set(df.columns)
+    birth_cols = [c for c in map(build_births_col, species) if c in col_set]
+    death_cols = [c for c in map(build_deaths_col, species) if c in col_set]
+    
+    # One reduction per column block instead of one per species
+    date_min, date_max = df['date'].min(), df['date'].max()
+    
     return {
         'total_snapshots': len(df),
         'tick_range': (int(df['tick'].min()), int(df['tick'].max())),
-        'time_range': (df['date'].min(), df['date'].max()),
-        'duration_seconds': (df['date'].max() - df['date'].min()).total_seconds(),
+        'time_range': (date_min, date_max),
+        'duration_seconds': (date_max - date_min).total_seconds(),
         'species_count': len(species),
         'species_list': species,
-        'total_births': sum(df[build_births_col(sp)].sum() 
-                           for sp in species if build_births_col(sp) in df.columns),
-        'total_deaths': sum(df[build_deaths_col(sp)].sum() 
-                           for sp in species if build_deaths_col(sp) in df.columns),
+        'total_births': df[birth_cols].sum().sum() if birth_cols else 0,
+        'total_deaths': df[death_cols].sum().sum() if death_cols else 0,
     }
 
 
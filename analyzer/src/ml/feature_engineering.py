@@ -5,10 +5,18 @@ Philosophy: Simple functions compose. Each transformation is pure.
 No classes, just functions that transform data.
 """
 
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from typing import Dict, List, Tuple
 import pandas as pd
 import numpy as np
 
+try:
+    from .kernels import rolling_cv, rolling_std
+except ImportError:
+    # Running as main script
+    from kernels import rolling_cv, rolling_std
+
 
 # ============================================
 # Rate Calculations (Pure Functions)
@@ -51,13 +59,46 @@ def calculate_growth_rate(births: pd.Series, deaths: pd.Series,
     return net_change / denominator.replace(0, float('nan'))
 
 
+def calculate_vital_rates(births: pd.Series, deaths: pd.Series,
+                          population: pd.Series,
+                          delta_seconds: pd.Series) -> Tuple[pd.Series, pd.Series, pd.Series]:
+    """
+    Calculate birth, death and growth rates in one pass
+    
+    Same results as calculate_birth_rate / death_rate / growth_rate, but the
+    per-capita denominator is computed once and shared.
+    Returns (birth_rate, death_rate, growth_rate); NaN where population is 0.
+    """
+    b = births.to_numpy(dtype=np.float64)
+    d = deaths.to_numpy(dtype=np.float64)
+    denom = population.to_numpy(dtype=np.float64) * delta_seconds.to_numpy(dtype=np.float64)
+    denom[denom == 0] = np.nan
+    
+    index = births.index
+    return (
+        pd.Series(b / denom, index=index),
+        pd.Series(d / denom, index=index),
+        pd.Series((b - d) / denom, index=index),
+    )
+
+
 def calculate_population_change_pct(population: pd.Series) -> pd.Series:
     """
     Calculate percentage change in population from previous tick
     
-    Returns Series with first value as NaN.
+    Returns Series with first value as NaN. Gaps are forward-filled first,
+    like pandas pct_change.
     """
-    return population.pct_change() * 100
+    if population.hasnans:
+        population = population.ffill()
+    p = population.to_numpy(dtype=np.float64)
+    out = np.empty_like(p)
+    if len(p):
+        out[0] = np.nan
+        with np.errstate(divide='ignore', invalid='ignore'):
+            np.divide(np.diff(p), p[:-1], out=out[1:])
+        out *= 100
+    return pd.Series(out, index=population.index, name=population.name)
 
 
 # ============================================
@@ -72,17 +113,19 @@ def normalize_min_max(series: pd.Series,
     Scales values to [min, max] range.
     Returns original series if all values are equal.
     """
-    min_val = series.min()
-    max_val = series.max()
+    values = series.to_numpy(dtype=np.float64)
+    valid = values[~np.isnan(values)] if series.hasnans else values
+    min_val, max_val = (valid.min(), valid.max()) if len(valid) else (np.nan, np.nan)
     
     if min_val == max_val:
         # All values are the same, return midpoint of range
         return pd.Series([np.mean(feature_range)] * len(series), index=series.index)
     
     # Scale to [0, 1] then to feature_range
-    normalized = (series - min_val) / (max_val - min_val)
+    normalized = (values - min_val) / (max_val - min_val)
     range_min, range_max = feature_range
-    return normalized * (range_max - range_min) + range_min
+    return pd.Series(normalized * (range_max - range_min) + range_min,
+                     index=series.index, name=series.name)
 
 
 def normalize_z_score(series: pd.Series) -> pd.Series:
@@ -92,13 +135,15 @@ def normalize_z_score(series: pd.Series) -> pd.Series:
     Transforms to mean=0, std=1.
     Returns zeros if std is 0.
     """
-    mean = series.mean()
-    std = series.std()
+    values = series.to_numpy(dtype=np.float64)
+    valid = values[~np.isnan(values)] if series.hasnans else values
+    mean = valid.mean() if len(valid) else np.nan
+    std = valid.std(ddof=1) if len(valid) > 1 else np.nan
     
     if std == 0:
         return pd.Series([0] * len(series), index=series.index)
     
-    return (series - mean) / std
+    return pd.Series((values - mean) / std, index=series.index, name=series.name)
 
 
 def normalize_log(series: pd.Series, offset: float = 1.0) -> pd.Series:
@@ -131,10 +176,12 @@ def calculate_rolling_cv(series: pd.Series, window: int) -> pd.Series:
     
     CV = std / mean
     Lower CV = more stable
+    NaN where the rolling mean is 0. Mean and std come from one fused
+    cumulative-sum pass (see kernels.rolling_cv).
     """
-    rolling_mean = calculate_rolling_mean(series, window)
-    rolling_std = calculate_rolling_std(series, window)
-    return rolling_std / rolling_mean.replace(0, float('nan'))
+    cv = rolling_cv(series.to_numpy(dtype=np.float64), window, min_periods=1)
+    cv[np.isinf(cv)] = np.nan  # zero-mean windows
+    return pd.Series(cv, index=series.index, name=series.name)
 
 
 def calculate_rolling_min(series: pd.Series, window: int) -> pd.Series:
@@ -165,11 +212,20 @@ def create_multiple_lags(series: pd.Series, lags: List[int]) -> pd.DataFrame:
     Create multiple lag features
     
     Returns DataFrame with columns: lag_1, lag_2, lag_3, etc.
+    Same values as create_lag_feature per lag, filled into one NaN buffer.
     """
-    result = pd.DataFrame(index=series.index)
-    for lag in lags:
-        result[f'lag_{lag}'] = create_lag_feature(series, lag)
-    return result
+    values = series.to_numpy()
+    dtype = values.dtype if np.issubdtype(values.dtype, np.floating) else np.float64
+    n = len(values)
+    
+    out = np.full((n, len(lags)), np.nan, dtype=dtype)
+    for i, lag in enumerate(lags):
+        if lag >= 0:
+            out[lag:, i] = values[:max(n - lag, 0)]
+        else:
+            out[:max(n + lag, 0), i] = values[-lag:]
+    
+    return pd.DataFrame(out, index=series.index, columns=[f'lag_{lag}' for lag in lags])
 
 
 # ============================================
@@ -226,14 +282,21 @@ def detect_oscillation(series: pd.Series, window: int = 10) -> pd.Series:
     Oscillation = high frequency of sign changes in derivative.
     """
     # Calculate derivative (difference)
-    derivative = series.diff()
+    derivative = np.diff(series.to_numpy(dtype=np.float64))
     
-    # Count sign changes in rolling window
-    sign_changes = (derivative.shift(1) * derivative < 0).astype(int)
-    oscillation_count = sign_changes.rolling(window, min_periods=1).sum()
+    # Sign changes between consecutive derivatives (zeros/NaN don't count);
+    # the first two rows have no pair to compare
+    sign_changes = np.zeros(len(series), dtype=np.int64)
+    sign_changes[2:] = derivative[1:] * derivative[:-1] < 0
+    
+    # Trailing-window counts via cumulative sums (partial leading windows)
+    csum = np.concatenate(([0], np.cumsum(sign_changes)))
+    end = np.arange(1, len(series) + 1)
+    oscillation_count = csum[end] - csum[np.maximum(end - window, 0)]
     
     # Normalize to [0, 1]
-    return (oscillation_count / window).clip(0, 1)
+    return pd.Series(np.clip(oscillation_count / window, 0, 1),
+                     index=series.index, name=series.name)
 
 
 def calculate_volatility(series: pd.Series, window: int = 10) -> pd.Series:
@@ -241,9 +304,20 @@ def calculate_volatility(series: pd.Series, window: int = 10) -> pd.Series:
     Calculate volatility (rolling standard deviation of returns)
     
     Higher volatility = more unstable
+    Returns are computed like pct_change (gaps forward-filled, inf after a
+    zero) and fed straight into the rolling-std kernel, without the
+    intermediate Series.
     """
-    returns = series.pct_change()
-    return calculate_rolling_std(returns, window)
+    if series.hasnans:
+        series = series.ffill()
+    values = series.to_numpy(dtype=np.float64)
+    
+    returns = np.full(len(values), np.nan)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        returns[1:] = values[1:] / values[:-1] - 1
+    
+    return pd.Series(rolling_std(returns, window, min_periods=1),
+                     index=series.index, name=series.name)
 
 
 # ============================================
@@ -264,13 +338,33 @@ def label_encode(series: pd.Series) -> Tuple[pd.Series, Dict[str, int]]:
     Label encode categorical series
     
     Returns (encoded_series, mapping_dict)
+    Codes follow the sorted unique values; missing values stay NaN.
     """
-    unique_values = sorted(series.unique())
-    mapping = {val: idx for idx, val in enumerate(unique_values)}
-    encoded = series.map(mapping)
+    codes, uniques = pd.factorize(series, sort=True)
+    mapping = {val: idx for idx, val in enumerate(uniques)}
+    encoded = pd.Series(codes, index=series.index, name=series.name)
+    if (codes < 0).any():
+        encoded = encoded.where(codes >= 0)
     return encoded, mapping
 
 
+def classify_growth(growth_rate: pd.Series, threshold: float = 0.01) -> pd.Series:
+    """
+    Classify growth rates as declining / stable / growing
+    
+    Same bins as pd.cut(growth_rate, [-inf, -threshold, threshold, inf]):
+    declining <= -threshold < stable <= threshold < growing; NaN (and -inf,
+    outside the open lowest bin) becomes NaN.
+    Returns a categorical Series, built from two vectorized comparisons.
+    """
+    values = growth_rate.to_numpy(dtype=np.float64)
+    codes = (values > -threshold).astype(np.int8) + (values > threshold)
+    codes[~(values > -np.inf)] = -1
+    categories = pd.CategoricalDtype(['declining', 'stable', 'growing'], ordered=True)
+    return pd.Series(pd.Categorical.from_codes(codes, dtype=categories),
+                     index=growth_rate.index, name=growth_rate.name)
+
+
 # ============================================
 # Feature Interaction
 # ============================================
@@ -289,17 +383,32 @@ def create_polynomial_features(series: pd.Series, degree: int = 2) -> pd.DataFra
     Create polynomial features up to specified degree
     
     Returns DataFrame with columns: x, x^2, x^3, etc.
+    Each power is the previous one times x (no pow calls), written into
+    one (ticks x degree) buffer.
     """
-    result = pd.DataFrame(index=series.index)
-    for d in range(1, degree + 1):
-        result[f'{series.name}_pow_{d}'] = series ** d
-    return result
+    values = series.to_numpy()
+    powers = np.empty((len(values), max(degree, 0)), dtype=values.dtype)
+    if degree >= 1:
+        powers[:, 0] = values
+    for d in range(1, degree):
+        np.multiply(powers[:, d - 1], values, out=powers[:, d])
+    
+    return pd.DataFrame(powers, index=series.index,
+                        columns=[f'{series.name}_pow_{d}' for d in range(1, degree + 1)])
 
 
 # ============================================
 # Aggregation Helpers
 # ============================================
 
+@lru_cache(maxsize=128)
+def _species_with_metric(columns: Tuple[str, ...], species: Tuple[str, ...],
+                         metric: str) -> Tuple[str, ...]:
+    """Species (in order) that have a '{species}_{metric}' column"""
+    col_set = set(columns)
+    return tuple(sp for sp in species if f'{sp}_{metric}' in col_set)
+
+
 def aggregate_species_metric(df: pd.DataFrame, species: List[str], 
                              metric: str) -> pd.Series:
     """
@@ -308,9 +417,16 @@ def aggregate_species_metric(df: pd.DataFrame, species: List[str],
     Example: aggregate_species_metric(df, ['prey1', 'prey2'], 'population')
     Returns total population across all prey species.
     """
-    cols = [f'{sp}_{metric}' for sp in species]
-    available_cols = [col for col in cols if col in df.columns]
-    return df[available_cols].sum(axis=1)
+    present = _species_with_metric(tuple(df.columns), tuple(species), metric)
+    block = df[[f'{sp}_{metric}' for sp in present]]
+    
+    # Row sums on one homogeneous array: int64 for all-integer columns,
+    # otherwise NaN-skipping float64 (same as DataFrame.sum(axis=1))
+    if len(present) and all(pd.api.types.is_integer_dtype(t) for t in block.dtypes):
+        totals = block.to_numpy(dtype=np.int64).sum(axis=1)
+    else:
+        totals = np.nansum(block.to_numpy(dtype=np.float64), axis=1)
+    return pd.Series(totals, index=df.index)
 
 
 def calculate_species_dominance(df: pd.DataFrame, species: List[str]) -> pd.DataFrame:
@@ -319,18 +435,16 @@ def calculate_species_dominance(df: pd.DataFrame, species: List[str]) -> pd.Data
     
     Returns DataFrame with dominance percentages for each species.
     """
-    result = pd.DataFrame(index=df.index)
-    pop_cols = [f'{sp}_population' for sp in species]
-    available_cols = [col for col in pop_cols if col in df.columns]
+    present = _species_with_metric(tuple(df.columns), tuple(species), 'population')
+    pop_mat = df[[f'{sp}_population' for sp in present]].to_numpy(dtype=np.float64)
     
-    total_pop = df[available_cols].sum(axis=1)
+    # One divide over the (ticks x species) block; NaN where the total is 0
+    total_pop = np.nansum(pop_mat, axis=1)
+    total_pop[total_pop == 0] = np.nan
+    dominance = pop_mat / total_pop[:, None] * 100
     
-    for sp in species:
-        pop_col = f'{sp}_population'
-        if pop_col in df.columns:
-            result[f'{sp}_dominance'] = (df[pop_col] / total_pop.replace(0, float('nan'))) * 100
-    
-    return result
+    return pd.DataFrame(dominance, index=df.index,
+                        columns=[f'{sp}_dominance' for sp in present])
 
 
 # ============================================
@@ -338,19 +452,32 @@ def calculate_species_dominance(df: pd.DataFrame, species: List[str]) -> pd.Data
 # ============================================
 
 def apply_to_all_species(df: pd.DataFrame, species: List[str], 
-                        metric: str, func, **kwargs) -> pd.DataFrame:
+                        metric: str, func, n_jobs: int = 1, **kwargs) -> pd.DataFrame:
     """
     Apply function to metric for all species
     
     Example: apply_to_all_species(df, species, 'population', normalize_z_score)
     Returns DataFrame with normalized populations for all species.
+    
+    n_jobs > 1 (or -1 for all cores) runs species in a thread pool. Only
+    worth it when func spends its time in numpy/pandas kernels that release
+    the GIL (e.g. rolling windows on long series); pure-Python funcs should
+    stay serial.
     """
-    result = pd.DataFrame(index=df.index)
-    for sp in species:
-        col_name = f'{sp}_{metric}'
-        if col_name in df.columns:
-            result[f'{sp}_{metric}_transformed'] = func(df[col_name], **kwargs)
-    return result
+    present = _species_with_metric(tuple(df.columns), tuple(species), metric)
+    columns = [df[f'{sp}_{metric}'] for sp in present]
+    
+    if n_jobs != 1 and len(columns) > 1:
+        with ThreadPoolExecutor(max_workers=None if n_jobs == -1 else n_jobs) as pool:
+            results = list(pool.map(lambda col: func(col, **kwargs), columns))
+    else:
+        results = [func(col, **kwargs) for col in columns]
+    
+    # Build the frame once (no per-column inserts)
+    transformed = {
+        f'{sp}_{metric}_transformed': result for sp, result in zip(present, results)
+    }
+    return pd.DataFrame(transformed, index=df.index)
 
 
 # ============================================
@@ -374,13 +501,7 @@ if __name__ == '__main__':
         deaths_col = f'{sp}_deaths'
         
         if all(col in df.columns for col in [pop_col, births_col, deaths_col]):
-            birth_rate = calculate_birth_rate(
-                df[births_col], df[pop_col], df['deltaSeconds']
-            )
-            death_rate = calculate_death_rate(
-                df[deaths_col], df[pop_col], df['deltaSeconds']
-            )
-            growth_rate = calculate_growth_rate(
+            birth_rate, death_rate, growth_rate = calculate_vital_rates(
                 df[births_col], df[deaths_col], df[pop_col], df['deltaSeconds']
             )
             
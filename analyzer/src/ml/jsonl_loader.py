@@ -13,10 +13,21 @@ JSONL Format:
 
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple, Any
+import hashlib
 import json
+import os
 import pandas as pd
 import re
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Fast line parser when orjson is installed; its decode error subclasses
+# json.JSONDecodeError, so callers handle both the same way.
+_json_loads = orjson.loads if orjson is not None else json.loads
+
 
 # ============================================
 # JSONL Parsing - Core Functions
@@ -37,7 +48,7 @@ def parse_jsonl_line(line: str) -> Optional[Dict]:
         return None
 
     try:
-        return json.loads(line)
+        return _json_loads(line)
     except json.JSONDecodeError as e:
         print(f"⚠️  Warning: Failed to parse line: {line[:50]}... Error: {e}")
         return None
@@ -71,7 +82,7 @@ def extract_config_block(lines: List[str]) -> Optional[Dict]:
     # Join and parse as JSON
     config_json = "\n".join(config_lines)
     try:
-        return json.loads(config_json)
+        return _json_loads(config_json)
     except json.JSONDecodeError as e:
         print(f"⚠️  Warning: Failed to parse config block: {e}")
         return None
@@ -130,19 +141,27 @@ def load_jsonl_file(file_path: str) -> Tuple[List[Dict], Optional[Dict], Dict]:
     if not path.exists():
         raise FileNotFoundError(f"JSONL file not found: {file_path}")
 
-    with open(path, "r") as f:
-        lines = f.readlines()
+    # Read raw bytes: data lines are parsed straight from bytes, and only
+    # header/comment lines are ever decoded to str
+    raw_lines = path.read_bytes().splitlines()
 
-    # Extract config and metadata
-    config = extract_config_block(lines)
-    metadata = extract_metadata(lines)
+    # Extract config (comment lines) and metadata (first 20 lines)
+    comments = [line.decode() for line in raw_lines if line.lstrip().startswith(b"#")]
+    config = extract_config_block(comments)
+    metadata = extract_metadata([line.decode() for line in raw_lines[:20]])
 
-    # Parse data lines
+    # Parse data lines (inlined fast path; malformed lines go through
+    # parse_jsonl_line for the warning)
     snapshots = []
-    for line in lines:
-        data = parse_jsonl_line(line)
-        if data is not None:
-            snapshots.append(data)
+    append = snapshots.append
+    for line in raw_lines:
+        line = line.strip()
+        if not line or line[0] == 35:  # b"#"
+            continue
+        try:
+            append(_json_loads(line))
+        except (json.JSONDecodeError, UnicodeDecodeError):
+            parse_jsonl_line(line.decode(errors="replace"))
 
     return snapshots, config, metadata
 
@@ -199,17 +218,25 @@ def flatten_snapshot(snapshot: Dict, prefix: str = "") -> Dict:
     """
     flat = {}
 
-    for key, value in snapshot.items():
-        new_key = f"{prefix}{key}" if prefix else key
-
-        if isinstance(value, dict):
-            # Recursively flatten nested dicts
-            flat.update(flatten_snapshot(value, f"{new_key}_"))
-        elif isinstance(value, (list, tuple)):
-            # Convert lists to JSON strings (for now)
-            flat[new_key] = json.dumps(value)
+    # Iterative depth-first walk: a stack of (key prefix, items iterator)
+    # keeps the original key order without recursive calls
+    stack = [(prefix, iter(snapshot.items()))]
+    while stack:
+        key_prefix, items = stack[-1]
+        for key, value in items:
+            new_key = key_prefix + key if key_prefix else key
+
+            if isinstance(value, dict):
+                # Descend into nested dict, resume this level afterwards
+                stack.append((new_key + "_", iter(value.items())))
+                break
+            elif isinstance(value, (list, tuple)):
+                # Convert lists to JSON strings (for now)
+                flat[new_key] = json.dumps(value)
+            else:
+                flat[new_key] = value
         else:
-            flat[new_key] = value
+            stack.pop()
 
     return flat
 
@@ -228,16 +255,29 @@ def flatten_snapshots(snapshots: List[Dict]) -> List[Dict]:
 # ============================================
 
 
-def detect_species_from_snapshots(snapshots: List[Dict]) -> List[str]:
+# Consecutive snapshots without a new species before the scan stops early
+SPECIES_SCAN_PATIENCE = 100
+
+
+def detect_species_from_snapshots(
+    snapshots: List[Dict], full_scan: bool = True
+) -> List[str]:
     """
     Detect species from snapshot data
 
     Looks in populations, genetics, energy, etc.
     Returns sorted list of unique species names.
+
+    Every snapshot is inspected by default, since a species can first appear
+    mid-run. full_scan=False opts into stopping once SPECIES_SCAN_PATIENCE
+    snapshots in a row add nothing new (faster, but may miss late species).
     """
     species = set()
+    unchanged = 0
 
     for snapshot in snapshots:
+        known = len(species)
+
         # Check populations
         if "populations" in snapshot and isinstance(snapshot["populations"], dict):
             species.update(snapshot["populations"].keys())
@@ -250,6 +290,11 @@ def detect_species_from_snapshots(snapshots: List[Dict]) -> List[str]:
         if "energy" in snapshot and isinstance(snapshot["energy"], dict):
             species.update(snapshot["energy"].keys())
 
+        if not full_scan:
+            unchanged = unchanged + 1 if len(species) == known else 0
+            if unchanged >= SPECIES_SCAN_PATIENCE:
+                break
+
     return sorted(species)
 
 
@@ -288,11 +333,16 @@ def snapshots_to_dataframe(
     Returns DataFrame with one row per snapshot.
     """
     if flatten:
-        data = flatten_snapshots(snapshots)
+        # Nested dicts become '_'-joined columns (same as flatten_snapshot)
+        df = pd.json_normalize(snapshots, sep="_")
+
+        # Lists are kept as JSON strings, as in flatten_snapshot
+        for col in df.columns[df.dtypes == object]:
+            is_list = df[col].map(lambda v: isinstance(v, (list, tuple)))
+            if is_list.any():
+                df.loc[is_list, col] = df.loc[is_list, col].map(json.dumps)
     else:
-        data = snapshots
-
-    df = pd.DataFrame(data)
+        df = _records_to_dataframe(snapshots)
 
     # Convert timestamp to datetime if present
     if "timestamp" in df.columns:
@@ -307,6 +357,23 @@ def snapshots_to_dataframe(
     return df
 
 
+def _records_to_dataframe(records: List[Dict]) -> pd.DataFrame:
+    """
+    Build a DataFrame column by column from a list of dicts
+
+    Same result as pd.DataFrame(records) (columns in first-seen order,
+    missing keys become NaN) without the row-to-column transpose.
+    """
+    if not records:
+        return pd.DataFrame(records)
+
+    keys = dict.fromkeys(key for record in records for key in record)
+    nan = float("nan")
+    return pd.DataFrame(
+        {key: [record.get(key, nan) for record in records] for key in keys}
+    )
+
+
 # ============================================
 # Legacy CSV Compatibility
 # ============================================
@@ -329,54 +396,57 @@ def convert_jsonl_to_csv_format(
 
     Returns DataFrame compatible with old analyzer code.
     """
-    rows = []
-
-    for snapshot in snapshots:
-        row = {
-            "tick": snapshot.get("tick", 0),
-            "timestamp": snapshot.get("timestamp", 0),
-            "deltaSeconds": snapshot.get("deltaSeconds", 0),
-        }
-
-        # Populations
-        populations = snapshot.get("populations", {})
-        for sp in species:
-            row[f"{sp}_population"] = populations.get(sp, 0)
-
-        # Births and deaths
-        births = snapshot.get("births", {})
-        deaths = snapshot.get("deaths", {})
-        for sp in species:
-            row[f"{sp}_births"] = births.get(sp, 0)
-            row[f"{sp}_deaths"] = deaths.get(sp, 0)
-
-        # Death causes
-        death_causes = snapshot.get("deathsByCause", {})
-        for sp in species:
-            sp_causes = death_causes.get(sp, {})
-            for cause in ["old_age", "starvation", "predation"]:
-                row[f"{sp}_deaths_{cause}"] = sp_causes.get(cause, 0)
-
-        # Energy
-        energy = snapshot.get("energy", {})
-        for sp in species:
-            sp_energy = energy.get(sp, {})
-            row[f"{sp}_energy_mean"] = sp_energy.get("mean", 0)
-            row[f"{sp}_energy_min"] = sp_energy.get("min", 0)
-            row[f"{sp}_energy_max"] = sp_energy.get("max", 0)
-
-        # Food sources
-        food = snapshot.get("environment", {}).get("foodSources", {})
-        row["prey_food_count"] = food.get("prey", 0)
-        row["predator_food_count"] = food.get("predator", 0)
-
-        # Atmosphere
-        atmosphere = snapshot.get("atmosphere", {})
-        row["atmosphere_event"] = atmosphere.get("event", "none")
-
-        rows.append(row)
-
-    df = pd.DataFrame(rows)
+    if not snapshots:
+        return pd.DataFrame()
+
+    # Built column by column (dict of lists), so pandas skips the
+    # row-to-column transpose of a list of row dicts
+    def column(section: List[Dict], key: str, default: Any = 0) -> List:
+        return [entry.get(key, default) for entry in section]
+
+    cols = {
+        "tick": column(snapshots, "tick"),
+        "timestamp": column(snapshots, "timestamp"),
+        "deltaSeconds": column(snapshots, "deltaSeconds"),
+    }
+
+    # Populations
+    populations = [s.get("populations", {}) for s in snapshots]
+    for sp in species:
+        cols[f"{sp}_population"] = column(populations, sp)
+
+    # Births and deaths
+    births = [s.get("births", {}) for s in snapshots]
+    deaths = [s.get("deaths", {}) for s in snapshots]
+    for sp in species:
+        cols[f"{sp}_births"] = column(births, sp)
+        cols[f"{sp}_deaths"] = column(deaths, sp)
+
+    # Death causes
+    death_causes = [s.get("deathsByCause", {}) for s in snapshots]
+    for sp in species:
+        sp_causes = [dc.get(sp, {}) for dc in death_causes]
+        for cause in ["old_age", "starvation", "predation"]:
+            cols[f"{sp}_deaths_{cause}"] = column(sp_causes, cause)
+
+    # Energy
+    energy = [s.get("energy", {}) for s in snapshots]
+    for sp in species:
+        sp_energy = [e.get(sp, {}) for e in energy]
+        cols[f"{sp}_energy_mean"] = column(sp_energy, "mean")
+        cols[f"{sp}_energy_min"] = column(sp_energy, "min")
+        cols[f"{sp}_energy_max"] = column(sp_energy, "max")
+
+    # Food sources
+    food = [s.get("environment", {}).get("foodSources", {}) for s in snapshots]
+    cols["prey_food_count"] = column(food, "prey")
+    cols["predator_food_count"] = column(food, "predator")
+
+    # Atmosphere
+    atmosphere = [s.get("atmosphere", {}) for s in snapshots]
+    cols["atmosphere_event"] = column(atmosphere, "event", "none")
+
+    df = pd.DataFrame(cols)
 
     # Convert timestamp to datetime
     if "timestamp" in df.columns:
@@ -409,8 +479,9 @@ def load_evolution_jsonl(
     snapshots, config, metadata = load_jsonl_file(file_path)
 
     if format == "csv":
-        # Convert to legacy CSV format
-        species = detect_species_from_snapshots(snapshots)
+        # Convert to legacy CSV format (species from the config header when
+        # present, otherwise scanned from the snapshots)
+        species = detect_species_from_config(config) or detect_species_from_snapshots(snapshots)
         df = convert_jsonl_to_csv_format(snapshots, species)
     elif format == "raw":
         # Keep nested structures
@@ -459,6 +530,23 @@ def load_evolution_data(
         raise ValueError(f"Unsupported file format: {path.suffix}. Use .csv or .jsonl")
 
 
+def cache_path(file_path: str, kind: str) -> Path:
+    """
+    Location of an on-disk parse cache for a data file
+
+    Caches live under $XDG_CACHE_HOME (default ~/.cache), never next to the
+    data, so a shared export is never paired with a pickle someone else wrote.
+    The name keeps the source name and suffix plus a digest of the resolved
+    path, cache kind and pandas version: caches of evolution.csv and
+    evolution.jsonl never collide, and a pandas upgrade starts fresh.
+    """
+    source = Path(file_path).resolve()
+    key = f"{source}\0{kind}\0{pd.__version__}".encode()
+    digest = hashlib.sha1(key).hexdigest()[:12]
+    root = Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache")
+    return root / "emergent-boids" / f"{source.name}.{kind}.{digest}.pkl"
+
+
 # ============================================
 # Genetics Data Extraction
 # ============================================
@@ -517,18 +605,36 @@ def extract_all_genetics(snapshots: List[Dict]) -> Dict[str, pd.DataFrame]:
             traits = list(genetics[first_species].get("traits", {}).keys())
             break
 
+    # One pass over the snapshots collects the sampled rows of every
+    # (species, trait) pair, instead of one full scan per pair
+    stats = ["mean", "min", "max", "stdDev"]
+    rows = {(sp, trait): [] for sp in species_list for trait in traits}
+
+    for snapshot in snapshots:
+        genetics = snapshot.get("genetics", {})
+        if not genetics:
+            continue
+        for species in species_list:
+            sp_traits = genetics.get(species, {}).get("traits", {})
+            for trait in traits:
+                trait_data = sp_traits.get(trait, {})
+                if trait_data:
+                    rows[species, trait].append([trait_data.get(s) for s in stats])
+
     result = {}
 
     for species in species_list:
-        # Extract all traits for this species
+        # Assemble all traits for this species (same columns as
+        # extract_genetics_timeseries, forward-filled per trait)
         species_data = {}
 
         for trait in traits:
-            trait_df = extract_genetics_timeseries(snapshots, species, trait)
+            if not rows[species, trait]:
+                continue
+            trait_df = pd.DataFrame(rows[species, trait], columns=stats).ffill()
             # Add columns with trait prefix
-            for col in ["mean", "min", "max", "stdDev"]:
-                if col in trait_df.columns:
-                    species_data[f"{trait}_{col}"] = trait_df[col]
+            for col in stats:
+                species_data[f"{trait}_{col}"] = trait_df[col]
 
         if species_data:
             result[species] = pd.DataFrame(species_data)
@@ -0,0 +1,220 @@
+"""
+Kernels Module - Vectorized numeric building blocks
+
+Philosophy: Simple functions compose. Each kernel is pure.
+Plain numpy on (ticks x columns) arrays, shared by the analysis modules.
+"""
+
+from typing import Optional, Tuple
+import numpy as np
+
+
+# ============================================
+# Rolling Statistics
+# ============================================
+
+def _block_moments(values: np.ndarray, window: int,
+                   ddof: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Trailing-window count, mean and std for every row of one block
+
+    O(n) via cumulative sums on centered data. The center is rounded to an
+    integer so integer data (counts) stays exact, and windows whose values
+    are all equal get exactly 0 std, as in pandas.
+    """
+    valid = ~np.isnan(values)
+    if valid.any():
+        with np.errstate(invalid='ignore'):
+            center = np.nan_to_num(np.round(np.nanmean(values, axis=0)))
+    else:
+        center = 0.0
+    centered = np.where(valid, values - center, 0.0)
+
+    # Forward-filled values only change where a new distinct value shows up
+    rows = np.where(valid, np.arange(len(values)).reshape((-1,) + (1,) * (values.ndim - 1)), 0)
+    filled = np.take_along_axis(np.where(valid, values, 0.0),
+                                np.maximum.accumulate(rows, axis=0), axis=0)
+    changed = np.zeros(values.shape)
+    changed[1:] = filled[1:] != filled[:-1]
+
+    pad = np.zeros((1,) + values.shape[1:])
+    csum = np.concatenate((pad, np.cumsum(centered, axis=0)))
+    csum_sq = np.concatenate((pad, np.cumsum(centered * centered, axis=0)))
+    ccount = np.concatenate((pad, np.cumsum(valid, axis=0)))
+    cchanged = np.concatenate((pad, np.cumsum(changed, axis=0)))
+
+    # Window start for each row (clamped at 0 for the leading partial windows)
+    end = np.arange(1, len(values) + 1)
+    start = np.maximum(end - window, 0)
+    sums = csum[end] - csum[start]
+    sums_sq = csum_sq[end] - csum_sq[start]
+    counts = ccount[end] - ccount[start]
+    constant = cchanged[end] - cchanged[np.minimum(start + 1, end)] == 0
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        mean = sums / counts + center
+        var = (sums_sq - sums * sums / counts) / (counts - ddof)
+    std = np.sqrt(np.maximum(var, 0.0))
+    std[constant] = 0.0
+    std[counts - ddof <= 0] = np.nan
+    return counts, mean, std
+
+
+def _rolling_moments(values: np.ndarray, window: int, ddof: int = 1,
+                     block: int = 4096) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Trailing-window count, mean and std for every row
+
+    Row i covers values[max(0, i - window + 1):i + 1]; NaNs are skipped
+    (counted out), like pandas rolling. Rows are processed in blocks, each
+    re-centered on its own mean with fresh cumulative sums, so a long
+    drifting series keeps the precision of a short one.
+    """
+    step = max(block, window)
+    counts = np.empty(values.shape)
+    mean = np.empty(values.shape)
+    std = np.empty(values.shape)
+    for lo in range(0, len(values), step):
+        hi = min(lo + step, len(values))
+        src = max(lo - window + 1, 0)
+        c, m, s = _block_moments(values[src:hi], window, ddof)
+        counts[lo:hi], mean[lo:hi], std[lo:hi] = c[lo - src:], m[lo - src:], s[lo - src:]
+    return counts, mean, std
+
+
+def rolling_mean_std(values: np.ndarray, window: int,
+                     ddof: int = 1) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Rolling mean and standard deviation over complete windows
+
+    values: 1D or 2D (ticks x columns) array
+    Row k of the result covers values[k:k + window].
+    Returns two arrays with len(values) - window + 1 rows (empty if too short).
+
+    Uses cumulative sums (O(n) regardless of window size). Columns are
+    centered first to keep the sum-of-squares numerically stable.
+    """
+    values = np.asarray(values, dtype=np.float64)
+    if window < 1 or len(values) < window:
+        empty = np.empty((0,) + values.shape[1:])
+        return empty, empty.copy()
+
+    _, mean, std = _rolling_moments(values, window, ddof)
+    return mean[window - 1:], std[window - 1:]
+
+
+def rolling_std(values: np.ndarray, window: int,
+                min_periods: Optional[int] = None, ddof: int = 1) -> np.ndarray:
+    """
+    Rolling standard deviation, aligned with the input
+
+    values: 1D or 2D (ticks x columns) array
+    Matches pandas rolling(window, min_periods).std(ddof): infinite values
+    are treated as missing, and rows with fewer than min_periods (default:
+    window) remaining values are NaN.
+    """
+    values = np.asarray(values, dtype=np.float64)
+    if min_periods is None:
+        min_periods = window
+    if len(values) == 0:
+        return values.copy()
+
+    counts, _, std = _rolling_moments(np.where(np.isinf(values), np.nan, values), window, ddof)
+    std[counts < min_periods] = np.nan
+    return std
+
+
+def rolling_cv(values: np.ndarray, window: int,
+               min_periods: Optional[int] = None) -> np.ndarray:
+    """
+    Rolling coefficient of variation (std / mean), aligned with the input
+
+    values: 1D or 2D (ticks x columns) array
+    Matches pandas rolling(window, min_periods).std() / .mean(): rows with
+    fewer than min_periods (default: window) non-NaN values are NaN, and
+    zero-mean windows give inf (or NaN when the std is 0 too).
+    """
+    values = np.asarray(values, dtype=np.float64)
+    if min_periods is None:
+        min_periods = window
+    if len(values) == 0:
+        return values.copy()
+
+    counts, mean, std = _rolling_moments(values, window)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        cv = std / mean
+    cv[counts < min_periods] = np.nan
+    return cv
+
+
+# ============================================
+# Equilibrium Scan
+# ============================================
+
+def first_stable_window(values: np.ndarray, window: int, threshold: float,
+                        block: int = 4096) -> Optional[int]:
+    """
+    Index of the first window where every column is stable
+
+    values: 2D (ticks x columns) array
+    A column is unstable in a window when its mean is > 0 and its
+    CV (std / mean) exceeds threshold; zero-mean columns count as stable.
+    Returns k such that values[k:k + window] is the first stable window,
+    or None if no window qualifies.
+
+    Scans in blocks of windows and stops at the first hit, so an early
+    equilibrium doesn't pay for the whole series.
+    """
+    values = np.asarray(values, dtype=np.float64)
+    n_windows = len(values) - window + 1
+
+    for start in range(0, max(n_windows, 0), block):
+        stop = min(start + block, n_windows)
+        mean, std = rolling_mean_std(values[start:stop + window - 1], window)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            unstable = (mean > 0) & (std / mean > threshold)
+        hits = np.flatnonzero(~unstable.any(axis=1))
+        if len(hits):
+            return start + int(hits[0])
+
+    return None
+
+
+# ============================================
+# Plot Downsampling
+# ============================================
+
+def m4_indices(x: np.ndarray, values: np.ndarray, n_bins: int) -> np.ndarray:
+    """
+    Row indices that keep a line plot visually identical (M4 aggregation)
+
+    x: sorted 1D array, values: 1D or 2D (ticks x columns) array
+    Splits the x range into n_bins equal-width bins and keeps, per bin and
+    column, the first, last, min and max rows. For 2D input the union over
+    columns is returned, so one index array serves every line.
+    Returns sorted unique row indices (all rows when already small enough).
+    """
+    n = len(x)
+    if n <= 4 * n_bins:
+        return np.arange(n)
+
+    values = np.asarray(values, dtype=np.float64)
+    if values.ndim == 1:
+        values = values[:, None]
+
+    # Bins are contiguous row segments since x is sorted; drop empty ones
+    edges = np.linspace(x[0], x[-1], n_bins + 1)[1:-1]
+    starts = np.unique(np.concatenate(([0], np.searchsorted(x, edges))))
+    starts = starts[starts < n]
+    lengths = np.diff(np.append(starts, n))
+    segment = np.repeat(np.arange(len(starts)), lengths)
+
+    picks = [starts, starts + lengths - 1]
+    for col in values.T:
+        # NaN-ignoring extrema per bin, then the first row hitting each one
+        for reduce in (np.fmin, np.fmax):
+            extreme = np.repeat(reduce.reduceat(col, starts), lengths)
+            hit = np.flatnonzero(col == extreme)
+            picks.append(hit[np.unique(segment[hit], return_index=True)[1]])
+
+    return np.unique(np.concatenate(picks))
@@ -5,15 +5,26 @@ Philosophy: Simple functions compose. Models are just functions.
 No classes, just pure transformations.
 """
 
-from typing import Dict, List, Tuple, Optional, Any
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Tuple, Optional, Any, NamedTuple
 import pandas as pd
 import numpy as np
+
+# Route sklearn estimators through Intel oneDAL (scikit-learn-intelex) when
+# available; must run before the estimators are imported. Unsupported
+# configurations (e.g. the saga solver) fall back to stock sklearn.
+# Set SKLEARNEX_VERBOSE=INFO to see which calls were accelerated.
+try:
+    from sklearnex import patch_sklearn
+    patch_sklearn()
+except ImportError:
+    pass
+
 from sklearn.model_selection import train_test_split
 from sklearn.linear_model import LinearRegression, LogisticRegression
 from sklearn.tree import DecisionTreeRegressor, DecisionTreeClassifier
 from sklearn.ensemble import RandomForestRegressor, RandomForestClassifier
 from sklearn.metrics import (
-    mean_squared_error, r2_score, mean_absolute_error,
     accuracy_score, precision_score, recall_score, f1_score,
     classification_report
 )
@@ -31,18 +42,36 @@ def prepare_features(df: pd.DataFrame, feature_cols: List[str],
     Returns (X, y) where X is features and y is target.
     Drops rows with NaN values.
     """
-    # Select features and target
-    data = df[feature_cols + [target_col]].copy()
-    
-    # Drop NaN values
-    data = data.dropna()
+    # Row mask from one numpy pass over the feature block (the target may be
+    # categorical, so it goes through pandas' isna)
+    features = df[feature_cols].to_numpy(dtype=np.float64, copy=False)
+    mask = ~np.isnan(features).any(axis=1) & df[target_col].notna().to_numpy()
+    
+    # Single selection per output (no intermediate copy + dropna)
+    if mask.all():
+        X, y = df[feature_cols], df[target_col].copy()
+    else:
+        X, y = df.loc[mask, feature_cols], df.loc[mask, target_col]
     
-    X = data[feature_cols]
-    y = data[target_col]
+    # String labels become categorical: encoded once, reused by the metrics
+    if y.dtype == object:
+        y = y.astype('category')
     
     return X, y
 
 
+def as_fit_matrix(X: pd.DataFrame) -> pd.DataFrame:
+    """
+    Float32, column-major copy of X for model fitting
+    
+    This is the layout sklearn trees convert their input to on every fit
+    and predict; converting once up front lets those calls use the data
+    in place. Column names and index are kept.
+    """
+    values = np.asfortranarray(X.to_numpy(dtype=np.float32))
+    return pd.DataFrame(values, index=X.index, columns=X.columns)
+
+
 def split_train_test(X: pd.DataFrame, y: pd.Series, 
                     test_size: float = 0.2, 
                     random_state: int = 42) -> Tuple[pd.DataFrame, pd.DataFrame, 
@@ -66,6 +95,36 @@ def train_linear_regression(X_train: pd.DataFrame, y_train: pd.Series) -> Any:
     return model
 
 
+class LinearFit(NamedTuple):
+    """Fitted linear model: y = X @ coef_ + intercept_"""
+    coef_: np.ndarray
+    intercept_: float
+
+    def predict(self, X: pd.DataFrame) -> np.ndarray:
+        return np.asarray(X, dtype=np.float64) @ self.coef_ + self.intercept_
+
+
+def train_linear_regression_fast(X_train: pd.DataFrame, y_train: pd.Series) -> LinearFit:
+    """
+    Train ordinary least squares via the normal equations
+    
+    Solves the small (features x features) system on centered data instead
+    of factorizing the full (rows x features) matrix. Collinear features
+    (e.g. growth_rate = birth_rate - death_rate) make the system singular,
+    so it is solved in the least-squares sense: the minimum-norm solution,
+    same as LinearRegression.
+    """
+    X = np.ascontiguousarray(X_train.to_numpy(dtype=np.float64))
+    y = np.asarray(y_train, dtype=np.float64)
+    
+    X_mean = X.mean(axis=0)
+    y_mean = y.mean()
+    Xc = X - X_mean
+    
+    coef = np.linalg.lstsq(Xc.T @ Xc, Xc.T @ (y - y_mean), rcond=None)[0]
+    return LinearFit(coef, float(y_mean - X_mean @ coef))
+
+
 def train_decision_tree_regressor(X_train: pd.DataFrame, y_train: pd.Series, 
                                   max_depth: Optional[int] = None) -> Any:
     """Train decision tree regressor"""
@@ -76,11 +135,22 @@ def train_decision_tree_regressor(X_train: pd.DataFrame, y_train: pd.Series,
 
 def train_random_forest_regressor(X_train: pd.DataFrame, y_train: pd.Series, 
                                   n_estimators: int = 100, 
-                                  max_depth: Optional[int] = None) -> Any:
-    """Train random forest regressor"""
+                                  max_depth: Optional[int] = 12,
+                                  max_samples: Optional[float] = 0.5,
+                                  max_features: Any = 1.0) -> Any:
+    """
+    Train random forest regressor
+    
+    Defaults bound tree depth and fit each tree on a bootstrap of half the
+    rows, which cuts fit and predict time far more than it costs accuracy.
+    All features stay split candidates: with only a handful of features,
+    'sqrt' costs regression accuracy badly.
+    """
     model = RandomForestRegressor(
         n_estimators=n_estimators, 
         max_depth=max_depth, 
+        max_samples=max_samples,
+        max_features=max_features,
         random_state=42,
         n_jobs=-1
     )
@@ -92,10 +162,26 @@ def train_random_forest_regressor(X_train: pd.DataFrame, y_train: pd.Series,
 # Classification Models
 # ============================================
 
+def _logistic_solver(n_samples: int, n_features: int, n_classes: int) -> str:
+    """
+    Pick the fastest-converging LogisticRegression solver for the data shape
+    
+    saga for wide data (more features than rows), newton-cholesky for binary
+    problems with few features, lbfgs otherwise.
+    """
+    if n_features > n_samples:
+        return 'saga'
+    if n_classes <= 2 and n_features < 100:
+        return 'newton-cholesky'
+    return 'lbfgs'
+
+
 def train_logistic_regression(X_train: pd.DataFrame, y_train: pd.Series, 
-                              max_iter: int = 1000) -> Any:
-    """Train logistic regression classifier"""
-    model = LogisticRegression(max_iter=max_iter, random_state=42)
+                              max_iter: int = 1000, tol: float = 1e-3) -> Any:
+    """Train logistic regression classifier (solver chosen from data shape)"""
+    n_samples, n_features = X_train.shape
+    solver = _logistic_solver(n_samples, n_features, pd.Series(y_train).nunique())
+    model = LogisticRegression(solver=solver, tol=tol, max_iter=max_iter, random_state=42)
     model.fit(X_train, y_train)
     return model
 
@@ -110,11 +196,21 @@ def train_decision_tree_classifier(X_train: pd.DataFrame, y_train: pd.Series,
 
 def train_random_forest_classifier(X_train: pd.DataFrame, y_train: pd.Series, 
                                    n_estimators: int = 100, 
-                                   max_depth: Optional[int] = None) -> Any:
-    """Train random forest classifier"""
+                                   max_depth: Optional[int] = 12,
+                                   max_samples: Optional[float] = 0.5,
+                                   max_features: Any = 'sqrt') -> Any:
+    """
+    Train random forest classifier
+    
+    Defaults bound tree depth and fit each tree on a bootstrap of half the
+    rows with sqrt(n_features) candidates per split, which cuts fit and
+    predict time far more than it costs accuracy.
+    """
     model = RandomForestClassifier(
         n_estimators=n_estimators, 
         max_depth=max_depth, 
+        max_samples=max_samples,
+        max_features=max_features,
         random_state=42,
         n_jobs=-1
     )
@@ -149,33 +245,61 @@ def evaluate_regression(y_true: pd.Series, y_pred: np.ndarray) -> Dict[str, floa
     
     Returns dict with MSE, RMSE, MAE, R²
     """
-    mse = mean_squared_error(y_true, y_pred)
-    rmse = np.sqrt(mse)
-    mae = mean_absolute_error(y_true, y_pred)
-    r2 = r2_score(y_true, y_pred)
+    batch = evaluate_regression_batch(y_true, np.asarray(y_pred)[None, :])
+    return {name: float(values[0]) for name, values in batch.items()}
+
+
+def evaluate_regression_batch(y_true: pd.Series, y_preds: np.ndarray) -> Dict[str, np.ndarray]:
+    """
+    Evaluate several models' predictions of the same target at once
+    
+    y_preds: (models x rows) array, one row of predictions per model
+    Returns dict of MSE, RMSE, MAE, R² arrays (one value per model).
+    R² follows sklearn for a constant target: 1 if predicted exactly, else 0.
+    """
+    y = np.asarray(y_true, dtype=np.float64)
+    n = len(y)
+    
+    # One residual buffer, reused in place for the absolute errors
+    err = np.subtract(y_preds, y, dtype=np.float64)
+    ss_res = np.einsum('ij,ij->i', err, err)
+    mse = ss_res / n
+    mae = np.abs(err, out=err).sum(axis=1) / n
+    
+    centered = y - y.mean()
+    ss_tot = centered @ centered
+    if ss_tot > 0:
+        r2 = 1 - ss_res / ss_tot
+    else:
+        r2 = np.where(ss_res == 0, 1.0, 0.0)
     
     return {
         'mse': mse,
-        'rmse': rmse,
+        'rmse': np.sqrt(mse),
         'mae': mae,
         'r2': r2,
     }
 
 
 def evaluate_regression_model(model: Any, X_train: pd.DataFrame, y_train: pd.Series, 
-                             X_test: pd.DataFrame, y_test: pd.Series) -> Dict[str, Dict[str, float]]:
+                             X_test: pd.DataFrame, y_test: pd.Series,
+                             y_pred: Optional[Tuple[np.ndarray, np.ndarray]] = None,
+                             include_train: bool = True) -> Dict[str, Dict[str, float]]:
     """
     Evaluate regression model on train and test sets
     
-    Returns dict with 'train' and 'test' metrics
+    y_pred: optional cached (train, test) predictions, skips predicting again.
+    include_train=False skips the train split (no train predict).
+    Returns dict with 'train' and 'test' metrics ('test' only without train)
     """
-    y_train_pred = predict(model, X_train)
-    y_test_pred = predict(model, X_test)
+    y_test_pred = predict(model, X_test) if y_pred is None else y_pred[1]
+    metrics = {'test': evaluate_regression(y_test, y_test_pred)}
     
-    return {
-        'train': evaluate_regression(y_train, y_train_pred),
-        'test': evaluate_regression(y_test, y_test_pred),
-    }
+    if include_train:
+        y_train_pred = predict(model, X_train) if y_pred is None else y_pred[0]
+        metrics = {'train': evaluate_regression(y_train, y_train_pred), **metrics}
+    
+    return metrics
 
 
 # ============================================
@@ -188,30 +312,87 @@ def evaluate_classification(y_true: pd.Series, y_pred: np.ndarray,
     Evaluate classification model performance
     
     Returns dict with accuracy, precision, recall, F1
+    All four come from one confusion matrix ('weighted', 'macro', 'micro');
+    other averages go through sklearn.
     """
+    if average not in ('weighted', 'macro', 'micro'):
+        return {
+            'accuracy': accuracy_score(y_true, y_pred),
+            'precision': precision_score(y_true, y_pred, average=average, zero_division=0),
+            'recall': recall_score(y_true, y_pred, average=average, zero_division=0),
+            'f1': f1_score(y_true, y_pred, average=average, zero_division=0),
+        }
+    
+    cm = _confusion_matrix(y_true, y_pred)
+    tp = np.diag(cm)
+    support = cm.sum(axis=1)
+    predicted = cm.sum(axis=0)
+    accuracy = float(tp.sum() / cm.sum())
+    
+    if average == 'micro':
+        # Every sample is counted once as predicted and once as true
+        return {'accuracy': accuracy, 'precision': accuracy, 'recall': accuracy, 'f1': accuracy}
+    
+    # Per-class scores; undefined ratios count as 0 (zero_division=0)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        precision = np.where(predicted > 0, tp / predicted, 0.0)
+        recall = np.where(support > 0, tp / support, 0.0)
+        f1 = np.where(support + predicted > 0, 2 * tp / (support + predicted), 0.0)
+    
+    weights = support if average == 'weighted' else None
     return {
-        'accuracy': accuracy_score(y_true, y_pred),
-        'precision': precision_score(y_true, y_pred, average=average, zero_division=0),
-        'recall': recall_score(y_true, y_pred, average=average, zero_division=0),
-        'f1': f1_score(y_true, y_pred, average=average, zero_division=0),
+        'accuracy': accuracy,
+        'precision': float(np.average(precision, weights=weights)),
+        'recall': float(np.average(recall, weights=weights)),
+        'f1': float(np.average(f1, weights=weights)),
     }
 
 
+def _confusion_matrix(y_true: pd.Series, y_pred: np.ndarray) -> np.ndarray:
+    """
+    (labels x labels) counts, rows = true label, columns = predicted label
+    
+    Labels are the union of both inputs. Categorical targets reuse their
+    codes, so only the predictions are encoded.
+    """
+    if isinstance(getattr(y_true, 'dtype', None), pd.CategoricalDtype):
+        n_labels = len(y_true.cat.categories)
+        true_codes = y_true.cat.codes.to_numpy()
+        pred_codes = pd.Categorical(y_pred, categories=y_true.cat.categories).codes
+        if (true_codes >= 0).all() and (pred_codes >= 0).all():
+            counts = np.bincount(true_codes * n_labels + pred_codes, minlength=n_labels * n_labels)
+            cm = counts.reshape(n_labels, n_labels)
+            # Drop categories absent from both inputs (they'd skew macro averages)
+            present = (cm.sum(axis=0) + cm.sum(axis=1)) > 0
+            return cm[present][:, present]
+    
+    codes, labels = pd.factorize(np.concatenate((np.asarray(y_true), np.asarray(y_pred))))
+    n_labels = len(labels)
+    true_codes, pred_codes = codes[:len(codes) // 2], codes[len(codes) // 2:]
+    counts = np.bincount(true_codes * n_labels + pred_codes, minlength=n_labels * n_labels)
+    return counts.reshape(n_labels, n_labels)
+
+
 def evaluate_classification_model(model: Any, X_train: pd.DataFrame, y_train: pd.Series, 
                                  X_test: pd.DataFrame, y_test: pd.Series, 
-                                 average: str = 'weighted') -> Dict[str, Dict[str, float]]:
+                                 average: str = 'weighted',
+                                 y_pred: Optional[Tuple[np.ndarray, np.ndarray]] = None,
+                                 include_train: bool = True) -> Dict[str, Dict[str, float]]:
     """
     Evaluate classification model on train and test sets
     
-    Returns dict with 'train' and 'test' metrics
+    y_pred: optional cached (train, test) predictions, skips predicting again.
+    include_train=False skips the train split (no train predict).
+    Returns dict with 'train' and 'test' metrics ('test' only without train)
     """
-    y_train_pred = predict(model, X_train)
-    y_test_pred = predict(model, X_test)
+    y_test_pred = predict(model, X_test) if y_pred is None else y_pred[1]
+    metrics = {'test': evaluate_classification(y_test, y_test_pred, average)}
     
-    return {
-        'train': evaluate_classification(y_train, y_train_pred, average),
-        'test': evaluate_classification(y_test, y_test_pred, average),
-    }
+    if include_train:
+        y_train_pred = predict(model, X_train) if y_pred is None else y_pred[0]
+        metrics = {'train': evaluate_classification(y_train, y_train_pred, average), **metrics}
+    
+    return metrics
 
 
 # ============================================
@@ -225,6 +406,25 @@ def get_feature_importance(model: Any, feature_names: List[str]) -> pd.DataFrame
     Works for tree-based models and linear models.
     Returns DataFrame sorted by importance.
     """
+    order, names, importance = _ranked_importance(model, feature_names)
+    return pd.DataFrame({'feature': names, 'importance': importance}, index=order)
+
+
+def get_feature_importance_fast(model: Any,
+                                feature_names: List[str]) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Feature importance as plain arrays, most important first
+    
+    Returns (feature names, importances). Skips the DataFrame, for calls
+    in loops over many models.
+    """
+    _, names, importance = _ranked_importance(model, feature_names)
+    return names, importance
+
+
+def _ranked_importance(model: Any,
+                       feature_names: List[str]) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """(order, names, importances) sorted by descending importance (ties keep input order)"""
     if hasattr(model, 'feature_importances_'):
         # Tree-based models
         importance = model.feature_importances_
@@ -236,55 +436,112 @@ def get_feature_importance(model: Any, feature_names: List[str]) -> pd.DataFrame
     else:
         raise ValueError("Model does not support feature importance extraction")
     
-    df = pd.DataFrame({
-        'feature': feature_names,
-        'importance': importance
-    })
-    
-    return df.sort_values('importance', ascending=False)
+    order = np.argsort(-importance, kind='stable')
+    return order, np.asarray(feature_names)[order], importance[order]
 
 
 # ============================================
 # Model Comparison
 # ============================================
 
+# Cached predictions: {model name: (train predictions, test predictions)}
+Predictions = Dict[str, Tuple[np.ndarray, np.ndarray]]
+
+# Below this many models a thread pool costs more than it saves
+PARALLEL_MIN_MODELS = 3
+
+# Rows per split used to rank models; a uniform sample this size estimates
+# the metrics to well within the gaps between candidates
+COMPARE_MAX_ROWS = 100_000
+
+
+def _sample_rows(X: pd.DataFrame, y: pd.Series, max_rows: Optional[int],
+                 random_state: int = 42) -> Tuple[pd.DataFrame, pd.Series]:
+    """Uniform sample of at most max_rows rows (in original order); None keeps all"""
+    if max_rows is None or len(X) <= max_rows:
+        return X, y
+    idx = np.sort(np.random.default_rng(random_state).choice(len(X), max_rows, replace=False))
+    return X.iloc[idx], y.iloc[idx]
+
+
+def predict_splits(models: Dict[str, Any], X_train: pd.DataFrame,
+                   X_test: pd.DataFrame) -> Predictions:
+    """
+    Predict train and test sets once per model
+    
+    Returns {name: (train predictions, test predictions)}, reusable by
+    evaluate_*_model and compare_*_models. Uses a thread pool: sklearn
+    predict releases the GIL, and every worker shares the same X.
+    """
+    def predict_both(model):
+        return predict(model, X_train), predict(model, X_test)
+    
+    if len(models) < PARALLEL_MIN_MODELS:
+        preds = [predict_both(model) for model in models.values()]
+    else:
+        with ThreadPoolExecutor() as pool:
+            preds = list(pool.map(predict_both, models.values()))
+    return dict(zip(models, preds))
+
+
 def compare_regression_models(models: Dict[str, Any], 
                              X_train: pd.DataFrame, y_train: pd.Series, 
-                             X_test: pd.DataFrame, y_test: pd.Series) -> pd.DataFrame:
+                             X_test: pd.DataFrame, y_test: pd.Series,
+                             predictions: Optional[Predictions] = None,
+                             max_rows: Optional[int] = COMPARE_MAX_ROWS) -> pd.DataFrame:
     """
     Compare multiple regression models
     
+    predictions: optional output of predict_splits for exactly these rows.
+    If omitted, each split is first sampled down to max_rows (None: all
+    rows) and predicted once per model.
     Returns DataFrame with metrics for each model.
     """
-    results = []
-    
-    for name, model in models.items():
-        metrics = evaluate_regression_model(model, X_train, y_train, X_test, y_test)
-        results.append({
-            'model': name,
-            'train_r2': metrics['train']['r2'],
-            'test_r2': metrics['test']['r2'],
-            'train_rmse': metrics['train']['rmse'],
-            'test_rmse': metrics['test']['rmse'],
-            'train_mae': metrics['train']['mae'],
-            'test_mae': metrics['test']['mae'],
-        })
+    if predictions is None:
+        X_train, y_train = _sample_rows(X_train, y_train, max_rows)
+        X_test, y_test = _sample_rows(X_test, y_test, max_rows)
+        predictions = predict_splits(models, X_train, X_test)
+    
+    # One batched metric pass per split over all models' predictions
+    names = list(models)
+    train = evaluate_regression_batch(y_train, np.vstack([predictions[name][0] for name in names]))
+    test = evaluate_regression_batch(y_test, np.vstack([predictions[name][1] for name in names]))
+    
+    results = pd.DataFrame({
+        'model': names,
+        'train_r2': train['r2'],
+        'test_r2': test['r2'],
+        'train_rmse': train['rmse'],
+        'test_rmse': test['rmse'],
+        'train_mae': train['mae'],
+        'test_mae': test['mae'],
+    })
     
-    return pd.DataFrame(results).sort_values('test_r2', ascending=False)
+    return results.sort_values('test_r2', ascending=False)
 
 
 def compare_classification_models(models: Dict[str, Any], 
                                  X_train: pd.DataFrame, y_train: pd.Series, 
-                                 X_test: pd.DataFrame, y_test: pd.Series) -> pd.DataFrame:
+                                 X_test: pd.DataFrame, y_test: pd.Series,
+                                 predictions: Optional[Predictions] = None,
+                                 max_rows: Optional[int] = COMPARE_MAX_ROWS) -> pd.DataFrame:
     """
     Compare multiple classification models
     
+    predictions: optional output of predict_splits for exactly these rows.
+    If omitted, each split is first sampled down to max_rows (None: all
+    rows) and predicted once per model.
     Returns DataFrame with metrics for each model.
     """
-    results = []
+    if predictions is None:
+        X_train, y_train = _sample_rows(X_train, y_train, max_rows)
+        X_test, y_test = _sample_rows(X_test, y_test, max_rows)
+        predictions = predict_splits(models, X_train, X_test)
     
+    results = []
     for name, model in models.items():
-        metrics = evaluate_classification_model(model, X_train, y_train, X_test, y_test)
+        metrics = evaluate_classification_model(model, X_train, y_train, X_test, y_test,
+                                                y_pred=predictions[name])
         results.append({
             'model': name,
             'train_accuracy': metrics['train']['accuracy'],
@@ -304,6 +561,28 @@ def compare_classification_models(models: Dict[str, Any],
 # Pipeline Composition
 # ============================================
 
+def _best_model_name(comparison: pd.DataFrame, metric: str) -> str:
+    """Model with the highest metric (NaN scores are skipped)"""
+    scores = comparison[metric].to_numpy(dtype=np.float64)
+    return comparison['model'].to_numpy()[np.nanargmax(scores)]
+
+
+def _fit_all(candidates: Dict[str, Tuple[Callable, Dict[str, Any]]],
+             X_train: pd.DataFrame, y_train: pd.Series) -> Dict[str, Any]:
+    """
+    Fit independent candidate models concurrently
+    
+    candidates maps name -> (train function, extra kwargs). sklearn fits
+    release the GIL, so wall time is the slowest fit rather than the sum.
+    """
+    with ThreadPoolExecutor(max_workers=len(candidates)) as pool:
+        futures = {
+            name: pool.submit(train, X_train, y_train, **kwargs)
+            for name, (train, kwargs) in candidates.items()
+        }
+        return {name: future.result() for name, future in futures.items()}
+
+
 def create_regression_pipeline(X: pd.DataFrame, y: pd.Series, 
                                test_size: float = 0.2) -> Dict[str, Any]:
     """
@@ -311,21 +590,22 @@ def create_regression_pipeline(X: pd.DataFrame, y: pd.Series,
     
     Returns dict with trained models and evaluation results.
     """
-    # Split data
-    X_train, X_test, y_train, y_test = split_train_test(X, y, test_size)
+    # Split data (converted once, shared by every model's fit and predict)
+    X_train, X_test, y_train, y_test = split_train_test(as_fit_matrix(X), y, test_size)
     
     # Train models
-    models = {
-        'Linear Regression': train_linear_regression(X_train, y_train),
-        'Decision Tree': train_decision_tree_regressor(X_train, y_train, max_depth=5),
-        'Random Forest': train_random_forest_regressor(X_train, y_train, n_estimators=50, max_depth=10),
-    }
-    
-    # Compare models
+    models = _fit_all({
+        'Linear Regression': (train_linear_regression_fast, {}),
+        'Decision Tree': (train_decision_tree_regressor, {'max_depth': 5}),
+        'Random Forest': (train_random_forest_regressor,
+                          {'n_estimators': 50, 'max_depth': 10}),
+    }, X_train, y_train)
+    
+    # Compare models (on sampled rows for large splits)
     comparison = compare_regression_models(models, X_train, y_train, X_test, y_test)
     
-    # Get best model
-    best_model_name = comparison.iloc[0]['model']
+    # Get best model (argmax of the metric, independent of the display sort)
+    best_model_name = _best_model_name(comparison, 'test_r2')
     best_model = models[best_model_name]
     
     return {
@@ -347,21 +627,22 @@ def create_classification_pipeline(X: pd.DataFrame, y: pd.Series,
     
     Returns dict with trained models and evaluation results.
     """
-    # Split data
-    X_train, X_test, y_train, y_test = split_train_test(X, y, test_size)
+    # Split data (converted once, shared by every model's fit and predict)
+    X_train, X_test, y_train, y_test = split_train_test(as_fit_matrix(X), y, test_size)
     
     # Train models
-    models = {
-        'Logistic Regression': train_logistic_regression(X_train, y_train),
-        'Decision Tree': train_decision_tree_classifier(X_train, y_train, max_depth=5),
-        'Random Forest': train_random_forest_classifier(X_train, y_train, n_estimators=50, max_depth=10),
-    }
-    
-    # Compare models
+    models = _fit_all({
+        'Logistic Regression': (train_logistic_regression, {}),
+        'Decision Tree': (train_decision_tree_classifier, {'max_depth': 5}),
+        'Random Forest': (train_random_forest_classifier,
+                          {'n_estimators': 50, 'max_depth': 10}),
+    }, X_train, y_train)
+    
+    # Compare models (on sampled rows for large splits)
     comparison = compare_classification_models(models, X_train, y_train, X_test, y_test)
     
-    # Get best model
-    best_model_name = comparison.iloc[0]['model']
+    # Get best model (argmax of the metric, independent of the display sort)
+    best_model_name = _best_model_name(comparison, 'test_f1')
     best_model = models[best_model_name]
     
     return {
@@ -383,8 +664,7 @@ def create_classification_pipeline(X: pd.DataFrame, y: pd.Series,
 if __name__ == '__main__':
     from data_loader import load_evolution_csv, detect_species_from_columns
     from feature_engineering import (
-        calculate_birth_rate, calculate_death_rate, 
-        calculate_growth_rate, normalize_z_score
+        calculate_vital_rates, normalize_z_score, classify_growth
     )
     
     print("🧪 Testing ML models...")
@@ -403,13 +683,7 @@ if __name__ == '__main__':
     deaths_col = f'{test_species}_deaths'
     
     # Calculate features
-    df['birth_rate'] = calculate_birth_rate(
-        df[births_col], df[pop_col], df['deltaSeconds']
-    )
-    df['death_rate'] = calculate_death_rate(
-        df[deaths_col], df[pop_col], df['deltaSeconds']
-    )
-    df['growth_rate'] = calculate_growth_rate(
+    df['birth_rate'], df['death_rate'], df['growth_rate'] = calculate_vital_rates(
         df[births_col], df[deaths_col], df[pop_col], df['deltaSeconds']
     )
     
@@ -436,7 +710,8 @@ if __name__ == '__main__':
     best_metrics = evaluate_regression_model(
         pipeline['best_model'], 
         pipeline['X_train'], pipeline['y_train'],
-        pipeline['X_test'], pipeline['y_test']
+        pipeline['X_test'], pipeline['y_test'],
+        include_train=False
     )
     print(f"  Test R²: {best_metrics['test']['r2']:.4f}")
     print(f"  Test RMSE: {best_metrics['test']['rmse']:.4f}")
@@ -450,11 +725,7 @@ if __name__ == '__main__':
     print("\n📊 Testing classification pipeline...")
     
     # Create stability classes
-    df['stability_class'] = pd.cut(
-        df['growth_rate'], 
-        bins=[-np.inf, -0.01, 0.01, np.inf],
-        labels=['declining', 'stable', 'growing']
-    )
+    df['stability_class'] = classify_growth(df['growth_rate'], threshold=0.01)
     
     X_class, y_class = prepare_features(df, feature_cols, 'stability_class')
     print(f"  Class distribution: {y_class.value_counts().to_dict()}")
@@ -468,7 +739,8 @@ if __name__ == '__main__':
     best_class_metrics = evaluate_classification_model(
         class_pipeline['best_model'],
         class_pipeline['X_train'], class_pipeline['y_train'],
-        class_pipeline['X_test'], class_pipeline['y_test']
+        class_pipeline['X_test'], class_pipeline['y_test'],
+        include_train=False
     )
     print(f"  Test Accuracy: {best_class_metrics['test']['accuracy']:.4f}")
     print(f"  Test F1: {best_class_metrics['test']['f1']:.4f}")
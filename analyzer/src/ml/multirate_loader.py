@@ -28,10 +28,13 @@ Usage:
     meta = load_metadata('datasets/evolution_1767034099147/')
 """
 
+import copy
 import json
 import zipfile
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, Optional, Any, List
+import numpy as np
 import pandas as pd
 
 from .jsonl_loader import (
@@ -93,6 +96,50 @@ def _list_files_in_source(source_path: Path) -> List[str]:
             return zf.namelist()
 
 
+def _source_mtime(source_path: Path, filename: str) -> float:
+    """Modification time of a file in the export (the archive itself for ZIPs)"""
+    if _is_folder_export(source_path):
+        return (source_path / filename).stat().st_mtime
+    return source_path.stat().st_mtime
+
+
+@lru_cache(maxsize=4)
+def _parse_rate(source_path: Path, filename: str, mtime: float) -> tuple:
+    """
+    Parse one snapshots file; memoized until the file changes on disk
+    
+    Kept small: each entry pins a full parsed frame, and the report reads
+    only a few rates. The cached objects are shared, so load_rate hands
+    out copies.
+    """
+    content = _load_text_from_source(source_path, filename)
+    snapshots, metadata, config = load_jsonl_file(content, is_string=True)
+    return snapshots_to_dataframe(snapshots), metadata, config
+
+
+def downcast_snapshots(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Narrow population counts and trait statistics to 32-bit dtypes
+    
+    populations_* columns become int32 (float32 if they have gaps, e.g. a
+    species that appeared mid-run); genetics_*_mean / *_stdDev become float32.
+    Other columns are left untouched.
+    
+    Args:
+        df: Snapshot DataFrame (as returned by load_rate)
+        
+    Returns:
+        New DataFrame with narrowed dtypes
+    """
+    dtypes = {}
+    for col in df.columns:
+        if col.startswith('populations_') and pd.api.types.is_numeric_dtype(df[col]):
+            dtypes[col] = np.float32 if df[col].isna().any() else np.int32
+        elif col.startswith('genetics_') and col.endswith(('_mean', '_stdDev')):
+            dtypes[col] = np.float32
+    return df.astype(dtypes)
+
+
 def load_metadata(source_path: str | Path) -> Dict[str, Any]:
     """
     Load metadata.json from multi-rate export (ZIP or folder)
@@ -183,7 +230,8 @@ def list_available_rates(source_path: str | Path) -> List[int]:
 def load_rate(
     source_path: str | Path,
     rate: int,
-    return_metadata: bool = False
+    return_metadata: bool = False,
+    downcast: bool = False
 ) -> pd.DataFrame | tuple[pd.DataFrame, Dict[str, Any], Dict[str, Any]]:
     """
     Load evolution data at a specific sampling rate from export (ZIP or folder)
@@ -192,6 +240,7 @@ def load_rate(
         source_path: Path to ZIP file or folder
         rate: Sampling rate to load (e.g., 1, 3, 10, 50, 100)
         return_metadata: If True, return (df, metadata, config) tuple
+        downcast: If True, narrow counts/trait stats to 32-bit (see downcast_snapshots)
         
     Returns:
         DataFrame with evolution data, or tuple if return_metadata=True
@@ -220,23 +269,21 @@ def load_rate(
             f"Rate {rate}x not found. Available rates: {available}"
         )
     
-    # Load JSONL content
-    content = _load_text_from_source(source_path, filename)
-    
-    # Parse JSONL content
-    snapshots, metadata, config = load_jsonl_file(content, is_string=True)
-    
-    # Convert to DataFrame
-    df = snapshots_to_dataframe(snapshots)
+    # Parse JSONL content (cached per file + mtime, callers get their own copy)
+    df, metadata, config = _parse_rate(
+        source_path.resolve(), filename, _source_mtime(source_path, filename)
+    )
+    df = downcast_snapshots(df) if downcast else df.copy()
     
     if return_metadata:
-        return df, metadata, config
+        return df, copy.deepcopy(metadata), copy.deepcopy(config)
     return df
 
 
 def load_multirate_export(
     source_path: str | Path,
-    rates: Optional[List[int]] = None
+    rates: Optional[List[int]] = None,
+    downcast: bool = False
 ) -> Dict[str, pd.DataFrame]:
     """
     Load all (or selected) sampling rates from multi-rate export (ZIP or folder)
@@ -244,6 +291,7 @@ def load_multirate_export(
     Args:
         source_path: Path to ZIP file or folder
         rates: List of rates to load (None = load all available)
+        downcast: If True, narrow counts/trait stats to 32-bit (see downcast_snapshots)
         
     Returns:
         Dictionary mapping rate names to DataFrames
@@ -291,7 +339,7 @@ def load_multirate_export(
     # Load each rate
     result = {}
     for rate in rates_to_load:
-        df = load_rate(source_path, rate)
+        df = load_rate(source_path, rate, downcast=downcast)
         result[f'{rate}x'] = df
         print(f"✅ Loaded {rate}x: {len(df)} snapshots")
     
@@ -9,6 +9,12 @@ from typing import Dict, List, Optional, Tuple
 import pandas as pd
 import numpy as np
 
+try:
+    from .kernels import rolling_mean_std
+except ImportError:
+    # Running as main script
+    from kernels import rolling_mean_std
+
 
 # ============================================
 # Population Stability Metrics
@@ -119,30 +125,19 @@ def calculate_biodiversity_index(df: pd.DataFrame, species: List[str]) -> pd.Ser
     
     Higher value = more diverse ecosystem
     """
-    result = []
-    
-    for idx in df.index:
-        populations = []
-        for sp in species:
-            pop_col = f'{sp}_population'
-            if pop_col in df.columns:
-                populations.append(df.loc[idx, pop_col])
-        
-        total = sum(populations)
-        if total == 0:
-            result.append(0)
-            continue
-        
-        # Calculate Shannon index
-        shannon = 0
-        for pop in populations:
-            if pop > 0:
-                p = pop / total
-                shannon -= p * np.log(p)
-        
-        result.append(shannon)
+    cols = [c for c in (f'{sp}_population' for sp in species) if c in df.columns]
+    populations = df[cols].to_numpy(dtype=np.float64, copy=False)
+    total = populations.sum(axis=1)
+    
+    # One pass over the (ticks x species) matrix; absent species add 0
+    with np.errstate(divide='ignore', invalid='ignore'):
+        p = populations / total[:, None]
+        log_p = np.log(p, where=p > 0, out=np.zeros_like(p))
+    shannon = -(p * log_p).sum(axis=1)
+    # Ticks with no positive population (all zero or all missing) score 0
+    shannon[~(populations > 0).any(axis=1)] = 0.0
     
-    return pd.Series(result, index=df.index)
+    return pd.Series(shannon, index=df.index)
 
 
 def detect_ecosystem_collapse(df: pd.DataFrame, species: List[str], 
@@ -153,18 +148,17 @@ def detect_ecosystem_collapse(df: pd.DataFrame, species: List[str],
     Collapse = more than threshold% of species go extinct
     Returns (collapsed, tick_of_collapse)
     """
-    for idx in df.index:
-        extinct_count = 0
-        for sp in species:
-            pop_col = f'{sp}_population'
-            if pop_col in df.columns and df.loc[idx, pop_col] == 0:
-                extinct_count += 1
-        
-        extinction_rate = extinct_count / len(species)
-        if extinction_rate > threshold:
-            return True, int(df.loc[idx, 'tick'])
+    cols = [c for c in (f'{sp}_population' for sp in species) if c in df.columns]
+    if not species:
+        return False, None
     
-    return False, None
+    # Extinct species per tick, as a fraction of all species
+    extinction_rate = (df[cols].to_numpy() == 0).sum(axis=1) / len(species)
+    collapsed = extinction_rate > threshold
+    if not collapsed.any():
+        return False, None
+    
+    return True, int(df['tick'].iat[int(collapsed.argmax())])
 
 
 # ============================================
@@ -178,25 +172,26 @@ def detect_equilibrium(df: pd.DataFrame, species: List[str],
     
     Equilibrium = all species have CV < threshold over rolling window
     Returns tick number when equilibrium is reached, or None.
+    The tick is the row right after the first qualifying window.
     """
-    for i in range(window, len(df)):
-        window_data = df.iloc[i-window:i]
-        all_stable = True
-        
-        for sp in species:
-            pop_col = f'{sp}_population'
-            if pop_col not in df.columns:
-                continue
-            
-            cv = calculate_coefficient_of_variation(window_data[pop_col])
-            if np.isnan(cv) or np.isinf(cv) or cv > cv_threshold:
-                all_stable = False
-                break
-        
-        if all_stable:
-            return int(df.iloc[i]['tick'])
+    if len(df) <= window:
+        return None
+    
+    cols = [c for c in (f'{sp}_population' for sp in species) if c in df.columns]
+    populations = df[cols].to_numpy(dtype=np.float64)
     
-    return None
+    # Row k covers rows k..k+window-1 and is reported at tick k+window,
+    # so the final complete window (no following row) is left out
+    mean, std = rolling_mean_std(populations[:-1], window)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        cv = std / mean
+    
+    # Zero-mean windows give inf/NaN CVs and count as unstable
+    stable = (np.isfinite(cv) & (cv <= cv_threshold)).all(axis=1)
+    if not stable.any():
+        return None
+    
+    return int(df['tick'].iat[int(stable.argmax()) + window])
 
 
 def calculate_time_to_equilibrium(df: pd.DataFrame, species: List[str], 
@@ -207,6 +202,11 @@ def calculate_time_to_equilibrium(df: pd.DataFrame, species: List[str],
     Returns None if equilibrium not reached.
     """
     equilibrium_tick = detect_equilibrium(df, species, window, cv_threshold)
+    return _seconds_until_tick(df, equilibrium_tick)
+
+
+def _seconds_until_tick(df: pd.DataFrame, equilibrium_tick: Optional[int]) -> Optional[float]:
+    """Seconds from the first snapshot to the one at equilibrium_tick (None passes through)"""
     if equilibrium_tick is None:
         return None
     
@@ -355,15 +355,16 @@ def generate_stability_report(df: pd.DataFrame, species: List[str]) -> Dict:
     
     Returns dict with all stability metrics.
     """
+    biodiversity = calculate_biodiversity_index(df, species)
     report = {
         'species_stability': {},
         'species_dynamics': {},
         'extinction_risk': {},
         'ecosystem_stability': calculate_ecosystem_stability(df, species),
         'biodiversity': {
-            'mean': calculate_biodiversity_index(df, species).mean(),
-            'min': calculate_biodiversity_index(df, species).min(),
-            'max': calculate_biodiversity_index(df, species).max(),
+            'mean': biodiversity.mean(),
+            'min': biodiversity.min(),
+            'max': biodiversity.max(),
         },
     }
     
@@ -379,7 +380,7 @@ def generate_stability_report(df: pd.DataFrame, species: List[str]) -> Dict:
     
     # Equilibrium
     equilibrium_tick = detect_equilibrium(df, species)
-    equilibrium_time = calculate_time_to_equilibrium(df, species)
+    equilibrium_time = _seconds_until_tick(df, equilibrium_tick)
     report['equilibrium'] = {
         'reached': equilibrium_tick is not None,
         'tick': equilibrium_tick,
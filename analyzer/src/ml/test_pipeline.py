@@ -10,6 +10,9 @@ Philosophy: Simple functions compose. Test the composition.
 import sys
 from pathlib import Path
 
+import numpy as np
+import pandas as pd
+
 # Import all our pure functional modules
 from data_loader import (
     load_evolution_csv, detect_species_from_columns, 
@@ -18,9 +21,10 @@ from data_loader import (
 )
 from feature_engineering import (
     calculate_birth_rate, calculate_death_rate, calculate_growth_rate,
+    calculate_vital_rates,
     normalize_z_score, calculate_rolling_cv, calculate_stability_score,
     calculate_prey_predator_ratio, aggregate_species_metric,
-    calculate_species_dominance
+    calculate_species_dominance, classify_growth
 )
 from stability_metrics import (
     calculate_population_stability, calculate_ecosystem_stability,
@@ -28,6 +32,7 @@ from stability_metrics import (
     classify_population_dynamics, generate_stability_report,
     calculate_predator_prey_stability
 )
+from kernels import rolling_cv, rolling_std
 from models import (
     prepare_features, create_regression_pipeline,
     create_classification_pipeline, get_feature_importance
@@ -158,9 +163,9 @@ def test_ml_models(df, species):
     deaths_col = f'{sp}_deaths'
     
     # Calculate features
-    df['birth_rate'] = calculate_birth_rate(df[births_col], df[pop_col], df['deltaSeconds'])
-    df['death_rate'] = calculate_death_rate(df[deaths_col], df[pop_col], df['deltaSeconds'])
-    df['growth_rate'] = calculate_growth_rate(df[births_col], df[deaths_col], df[pop_col], df['deltaSeconds'])
+    df['birth_rate'], df['death_rate'], df['growth_rate'] = calculate_vital_rates(
+        df[births_col], df[deaths_col], df[pop_col], df['deltaSeconds']
+    )
     df['next_population'] = df[pop_col].shift(-1)
     
     # Prepare data
@@ -188,14 +193,7 @@ def test_ml_models(df, species):
     
     # Test classification
     print(f"\n📊 Training classification models...")
-    import pandas as pd
-    import numpy as np
-    
-    df['stability_class'] = pd.cut(
-        df['growth_rate'], 
-        bins=[-np.inf, -0.01, 0.01, np.inf],
-        labels=['declining', 'stable', 'growing']
-    )
+    df['stability_class'] = classify_growth(df['growth_rate'], threshold=0.01)
     
     X_class, y_class = prepare_features(df, feature_cols, 'stability_class')
     class_pipeline = create_classification_pipeline(X_class, y_class, test_size=0.2)
@@ -209,6 +207,29 @@ def test_ml_models(df, species):
     return pipeline, class_pipeline
 
 
+def test_rolling_kernels():
+    """Test rolling kernels against pandas on a long drifting series"""
+    print("\n" + "="*70)
+    print("🧪 TEST 5: Rolling Kernels vs pandas")
+    print("="*70)
+    
+    # 1e6-tick random walk around 1e4, held for 100 ticks at a time so
+    # windows inside a hold are constant
+    rng = np.random.default_rng(0)
+    walk = 1e4 + np.cumsum(rng.normal(0, 5, 10_000))
+    series = pd.Series(np.repeat(walk, 100))
+    
+    for window in (10, 100):
+        rolling = series.rolling(window)
+        std = rolling_std(series.to_numpy(), window)
+        cv = rolling_cv(series.to_numpy(), window)
+        np.testing.assert_allclose(std, rolling.std(), rtol=0, atol=1e-3)
+        np.testing.assert_allclose(cv, rolling.std() / rolling.mean(), rtol=0, atol=1e-7)
+        held = np.arange(len(series)) % 100 >= window - 1
+        assert (std[held] == 0).all()
+        print(f"✅ window={window}: std and CV match pandas, constant windows give 0")
+
+
 def run_full_pipeline_test():
     """Run complete pipeline test"""
     print("\n" + "="*80)
@@ -231,6 +252,9 @@ def run_full_pipeline_test():
         # Test 4: ML Models
         reg_pipeline, class_pipeline = test_ml_models(df, species)
         
+        # Test 5: Rolling Kernels
+        test_rolling_kernels()
+        
         # Final summary
         print("\n" + "="*70)
         print("✅ ALL TESTS PASSED!")